@@ -13,7 +13,9 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from predibench.backend.data_loader import get_data_for_backend
+from predibench.agent.models import ModelInvestmentDecisions
+from predibench.backend.data_loader import compute_backend_profits, load_backend_inputs
+from predibench.backend.data_model import ModelPerformanceBackend
 from predibench.utils import apply_template
 
 
@@ -49,7 +51,8 @@ def kelly_bet_amount(estimated_prob: float, market_price: float) -> float:
 
 
 def calculate_model_average_returns_from_decisions(
-    backend_data, use_kelly: bool = False
+    enriched_model_decisions: list[ModelInvestmentDecisions],
+    performance_per_model: dict[str, ModelPerformanceBackend],
 ) -> dict:
     """
     Calculate average returns across all event decisions for each model,
@@ -60,113 +63,124 @@ def calculate_model_average_returns_from_decisions(
     """
     model_results = {}
 
-    # Get the data with or without Kelly recomputation
-    if use_kelly:
-        data = get_data_for_backend(recompute_bets_with_kelly_criterion=True)
-    else:
-        data = backend_data
-
-    # Group model decisions by model_id
-    decisions_by_model = {}
-    for decision in data.model_decisions:
-        if "baseline" in decision.model_info.inference_provider.lower():
-            continue
-        if decision.model_id not in decisions_by_model:
-            decisions_by_model[decision.model_id] = []
-        decisions_by_model[decision.model_id].append(decision)
-
-    for model_id, decisions in decisions_by_model.items():
-        # Collect all event decision returns (exactly like in compute_profits.py)
-        all_seven_day_returns = []
-
-        model_name = decisions[0].model_info.model_pretty_name
-
-        for decision in decisions:
-            for event_decision in decision.event_investment_decisions:
-                if event_decision.returns is not None:
-                    all_seven_day_returns.append(
-                        event_decision.returns.seven_day_return
-                    )
-
-        if all_seven_day_returns:
-            # Calculate average return (matching the leaderboard exactly)
-            avg_seven_day_return = float(np.mean(all_seven_day_returns))
-
-            # Calculate Sharpe ratio from the returns variance
-            if len(all_seven_day_returns) >= 2:
-                returns_array = np.array(all_seven_day_returns)
-                mean_return = np.mean(returns_array)
-                std_return = np.std(returns_array, ddof=1)
-
-                if std_return > 0 and not np.isnan(std_return):
-                    sharpe_ratio = mean_return / std_return
-                else:
-                    sharpe_ratio = 0.0
-            else:
-                sharpe_ratio = 0.0
-
-            # Get compound portfolio return from the performance data
-            if model_id in data.performance_per_model:
-                total_return = data.performance_per_model[model_id].final_profit
-            else:
-                total_return = 0.0
-
-            model_results[model_id] = {
-                "model_name": model_name,
-                "seven_day_return": avg_seven_day_return,
-                "sharpe_ratio": sharpe_ratio,
-                "total_return": total_return,
-            }
+    model_decisions = [
+        decision
+        for decision in enriched_model_decisions
+        if "baseline" not in decision.model_info.inference_provider.lower()
+    ]
+
+    # Flatten every event-level 7-day return (exactly like in compute_profits.py),
+    # tagged with its model_id, into arrays sized up front and filled by index
+    num_returns = sum(
+        event_decision.returns is not None
+        for decision in model_decisions
+        for event_decision in decision.event_investment_decisions
+    )
+    if num_returns == 0:
+        return model_results
+
+    model_names = {}
+    return_model_ids = np.empty(num_returns, dtype=object)
+    returns_array = np.empty(num_returns, dtype=np.float64)
+    position = 0
+    for decision in model_decisions:
+        model_names.setdefault(decision.model_id, decision.model_info.model_pretty_name)
+        for event_decision in decision.event_investment_decisions:
+            if event_decision.returns is not None:
+                return_model_ids[position] = decision.model_id
+                returns_array[position] = event_decision.returns.seven_day_return
+                position += 1
+
+    # Aggregate per model with vectorized group reductions
+    codes, model_ids = pd.factorize(return_model_ids)
+    counts = np.bincount(codes)
+    # Average return (matching the leaderboard exactly)
+    mean_returns = np.bincount(codes, weights=returns_array) / counts
+    std_returns = pd.Series(returns_array).groupby(codes).std(ddof=1).to_numpy()
+
+    for model_id, count, mean_return, std_return in zip(
+        model_ids, counts, mean_returns, std_returns
+    ):
+        # Calculate Sharpe ratio from the returns variance
+        if count >= 2 and std_return > 0 and not np.isnan(std_return):
+            sharpe_ratio = float(mean_return / std_return)
+        else:
+            sharpe_ratio = 0.0
+
+        # Get compound portfolio return from the performance data
+        if model_id in performance_per_model:
+            total_return = performance_per_model[model_id].final_profit
+        else:
+            total_return = 0.0
+
+        model_results[model_id] = {
+            "model_name": model_names[model_id],
+            "seven_day_return": float(mean_return),
+            "sharpe_ratio": sharpe_ratio,
+            "total_return": total_return,
+        }
 
     return model_results
 
 
-def analyze_bet_strategies(backend_data) -> pd.DataFrame:
+def analyze_bet_strategies(
+    model_decisions: list[ModelInvestmentDecisions], prices_df: pd.DataFrame
+) -> pd.DataFrame:
     """
     Analyze performance of original bet amounts vs Kelly-derived bet amounts.
 
+    Both strategies are computed from the same loaded decisions and prices: only
+    the profit computation is rerun for Kelly, not the whole backend data loading.
+
     Returns:
-        DataFrame with columns: model_name, strategy_type, seven_day_return, sharpe_ratio, total_return
+        Wide DataFrame indexed by model_id with a model_name column and, for each of
+        seven_day_return, sharpe_ratio and total_return, one "_original" and one
+        "_kelly" column
     """
-    strategy_results = []
+    metric_columns = ["model_name", "seven_day_return", "sharpe_ratio", "total_return"]
+
+    # Profit computation enriches decisions in place and Kelly rescales their bets,
+    # so the Kelly run works on its own copy of the decisions
+    kelly_model_decisions = [
+        decision.model_copy(deep=True) for decision in model_decisions
+    ]
 
     # Calculate original strategy results
     print("Calculating original strategy results...")
     original_results = calculate_model_average_returns_from_decisions(
-        backend_data, use_kelly=False
+        *compute_backend_profits(prices_df=prices_df, model_decisions=model_decisions)
     )
 
-    for model_id, metrics in original_results.items():
-        strategy_results.append(
-            {
-                "model_id": model_id,
-                "model_name": metrics["model_name"],
-                "strategy_type": "Original",
-                "seven_day_return": metrics["seven_day_return"],
-                "sharpe_ratio": metrics["sharpe_ratio"],
-                "total_return": metrics["total_return"],
-            }
-        )
-
     # Calculate Kelly strategy results
     print("Calculating Kelly strategy results...")
     kelly_results = calculate_model_average_returns_from_decisions(
-        backend_data, use_kelly=True
+        *compute_backend_profits(
+            prices_df=prices_df,
+            model_decisions=kelly_model_decisions,
+            recompute_bets_with_kelly_criterion=True,
+        )
     )
 
-    for model_id, metrics in kelly_results.items():
-        strategy_results.append(
-            {
-                "model_id": model_id,
-                "model_name": metrics["model_name"],
-                "strategy_type": "Kelly",
-                "seven_day_return": metrics["seven_day_return"],
-                "sharpe_ratio": metrics["sharpe_ratio"],
-                "total_return": metrics["total_return"],
-            }
-        )
+    # Join both strategies side by side on model_id, no tall-to-wide pivot needed
+    original_df = pd.DataFrame.from_dict(
+        original_results, orient="index", columns=metric_columns
+    )
+    kelly_df = pd.DataFrame.from_dict(
+        kelly_results, orient="index", columns=metric_columns
+    )
+    strategy_df = original_df.join(
+        kelly_df, how="outer", lsuffix="_original", rsuffix="_kelly"
+    )
+    strategy_df.insert(
+        0,
+        "model_name",
+        strategy_df.pop("model_name_original").fillna(
+            strategy_df.pop("model_name_kelly")
+        ),
+    )
+    strategy_df.index.name = "model_id"
 
-    return pd.DataFrame(strategy_results)
+    return strategy_df
 
 
 def create_seven_day_return_comparison_chart(strategy_df: pd.DataFrame) -> go.Figure:
@@ -181,22 +195,13 @@ def create_seven_day_return_comparison_chart(strategy_df: pd.DataFrame) -> go.Fi
         apply_template(fig, width=1400, height=800)
         return fig
 
-    # Pivot data for easier plotting
-    pivot_df = strategy_df.pivot(
-        index="model_name", columns="strategy_type", values="seven_day_return"
-    ).reset_index()
-
-    # Calculate difference (Kelly - Original)
-    pivot_df["difference"] = pivot_df["Kelly"] - pivot_df["Original"]
-    pivot_df["improvement"] = pivot_df["difference"] > 0
-
     # Sort by original bet amount performance (7-day returns), best to worst
-    pivot_df = pivot_df.sort_values("Original", ascending=False)
+    sorted_df = strategy_df.sort_values("seven_day_return_original", ascending=False)
 
     # Create grouped bar chart
-    models = pivot_df["model_name"]
-    original_values = pivot_df["Original"]
-    kelly_values = pivot_df["Kelly"]
+    models = sorted_df["model_name"]
+    original_values = sorted_df["seven_day_return_original"]
+    kelly_values = sorted_df["seven_day_return_kelly"]
 
     fig.add_trace(
         go.Bar(
@@ -274,7 +279,7 @@ def save_plotly_figure_as_json(strategy_df: pd.DataFrame) -> None:
     json_path = (json_out_dir / "bet_strategy_comparison.json").resolve()
 
     # Save as Plotly figure JSON
-    fig.write_json(str(json_path))
+    fig.write_json(str(json_path), engine="orjson")
 
     print(f"Plotly figure saved as JSON: {json_path}")
 
@@ -287,13 +292,14 @@ def main():
     print(
         "Analyzing performance differences between original and Kelly-derived bet amounts..."
     )
-    strategy_df = analyze_bet_strategies(get_data_for_backend())
+    model_decisions, _, prices_df = load_backend_inputs()
+    strategy_df = analyze_bet_strategies(model_decisions, prices_df)
 
     if strategy_df.empty:
         print("No strategy data found!")
         return
 
-    print(f"Analyzed {len(strategy_df['model_name'].unique())} models")
+    print(f"Analyzed {len(strategy_df)} models")
 
     # Create output directory
     repo_root = Path(__file__).resolve().parents[3]
@@ -313,16 +319,18 @@ def main():
     # Print summary statistics for 7-day return only
     print("\n=== ANALYSIS SUMMARY ===")
 
-    pivot_df = strategy_df.pivot(
-        index="model_name", columns="strategy_type", values="seven_day_return"
-    ).reset_index()
-    pivot_df = pivot_df.dropna()
+    returns_df = strategy_df[
+        ["model_name", "seven_day_return_original", "seven_day_return_kelly"]
+    ].dropna()
 
-    if not pivot_df.empty:
-        pivot_df["improvement"] = pivot_df["Kelly"] - pivot_df["Original"]
-        improved_count = (pivot_df["improvement"] > 0).sum()
-        total_count = len(pivot_df)
-        avg_improvement = pivot_df["improvement"].mean()
+    if not returns_df.empty:
+        returns_df["improvement"] = (
+            returns_df["seven_day_return_kelly"]
+            - returns_df["seven_day_return_original"]
+        )
+        improved_count = (returns_df["improvement"] > 0).sum()
+        total_count = len(returns_df)
+        avg_improvement = returns_df["improvement"].mean()
 
         print("\n7-Day Return:")
         print(
@@ -333,12 +341,12 @@ def main():
         )
 
         # Top improvers
-        top_improvers = pivot_df.nlargest(3, "improvement")
+        top_improvers = returns_df.nlargest(3, "improvement")
         print("  Top improvers:")
-        for _, row in top_improvers.iterrows():
-            print(
-                f"    {row['model_name']}: {row['improvement']:.3f} ({row['improvement'] * 100:.2f}%)"
-            )
+        for model_name, improvement in zip(
+            top_improvers["model_name"], top_improvers["improvement"]
+        ):
+            print(f"    {model_name}: {improvement:.3f} ({improvement * 100:.2f}%)")
 
     print(f"\nAnalysis complete! Results saved to: {html_out_dir}")
     print(f"HTML saved to: {html_path}")
@@ -1,19 +1,26 @@
-import json
+import hashlib
+import heapq
 import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, NamedTuple, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
+import orjson
 import seaborn as sns
 from dotenv import load_dotenv
 from huggingface_hub import login
+from matplotlib.colors import ListedColormap
 from predibench.agent.models import ModelInfo, ModelInvestmentDecisions
-from predibench.common import get_date_output_path
+from predibench.common import DATA_PATH, PREFIX_MODEL_RESULTS
 from predibench.invest import run_investments_for_specific_date
 from predibench.logger_config import get_logger
+from predibench.utils import date_to_string
 from pydantic import BaseModel
 
 load_dotenv(override=True)
@@ -22,19 +29,40 @@ login(os.getenv("HF_TOKEN"))
 logger = get_logger(__name__)
 
 
+def _run_dir_name(model_id: str, run_idx: int) -> str:
+    return f"{model_id.replace('/', '--')}_run_{run_idx}"
+
+
+def _date_output_dir(target_date: date) -> Path:
+    """Build the date output path without creating it, unlike get_date_output_path."""
+    return DATA_PATH / PREFIX_MODEL_RESULTS / date_to_string(target_date)
+
+
+def _scan_run_dirs(date_output_path: Path) -> set[str]:
+    """List the run directories already present for a date in a single scan."""
+    try:
+        with os.scandir(date_output_path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+
 def get_run_result_path(model_id: str, target_date: date, run_idx: int) -> Path:
     """Get the path where a specific run result should be saved."""
-    date_output_path = get_date_output_path(target_date)
-    run_result_path = date_output_path / f"{model_id.replace('/', '--')}_run_{run_idx}"
-    run_result_path.mkdir(parents=True, exist_ok=True)
-    return run_result_path
+    return _date_output_dir(target_date) / _run_dir_name(model_id, run_idx)
 
 
-def check_run_exists(model_id: str, target_date: date, run_idx: int) -> bool:
-    """Check if a run already exists by looking for the saved model result."""
-    run_result_path = get_run_result_path(model_id, target_date, run_idx)
-    result_file = run_result_path / "model_investment_decisions.json"
-    return result_file.exists()
+def ensure_run_dir(path: Path) -> Path:
+    """Create a run directory if needed and return it."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@lru_cache(maxsize=1024)
+def _load_decisions_cached(path_str: str, mtime_ns: int) -> ModelInvestmentDecisions:
+    """Parse a saved decisions file, memoized on its path and modification time."""
+    with open(path_str, "rb") as f:
+        return ModelInvestmentDecisions.model_validate(orjson.loads(f.read()))
 
 
 def load_existing_run(
@@ -44,10 +72,8 @@ def load_existing_run(
     run_result_path = get_run_result_path(model_id, target_date, run_idx)
     result_file = run_result_path / "model_investment_decisions.json"
 
-    with open(result_file, "r") as f:
-        data = json.load(f)
-
-    return ModelInvestmentDecisions(**data)
+    # Keying on mtime invalidates the cache when a run is rewritten
+    return _load_decisions_cached(str(result_file), result_file.stat().st_mtime_ns)
 
 
 def move_result_to_run_location(model_info: ModelInfo, target_date: date, run_idx: int):
@@ -57,13 +83,32 @@ def move_result_to_run_location(model_info: ModelInfo, target_date: date, run_id
     original_file = original_path / "model_investment_decisions.json"
 
     # New location for this specific run
-    run_path = get_run_result_path(model_info.model_id, target_date, run_idx)
+    run_path = ensure_run_dir(
+        get_run_result_path(model_info.model_id, target_date, run_idx)
+    )
     run_file = run_path / "model_investment_decisions.json"
 
     if original_file.exists():
-        import shutil
+        # Both paths live under the same output tree, so this is a single rename
+        os.replace(original_file, run_file)
 
-        shutil.move(str(original_file), str(run_file))
+
+def _stored_run_indices(model_id: str, num_runs: int, target_date: date) -> List[int]:
+    """Return the indices of runs whose results are already saved on disk."""
+    date_output_path = _date_output_dir(target_date)
+    existing_dirs = _scan_run_dirs(date_output_path)
+    stored_indices = []
+    for run_idx in range(num_runs):
+        # Only stat the result file for runs whose directory is already there
+        run_dir_name = _run_dir_name(model_id, run_idx)
+        if (
+            run_dir_name in existing_dirs
+            and (
+                date_output_path / run_dir_name / "model_investment_decisions.json"
+            ).exists()
+        ):
+            stored_indices.append(run_idx)
+    return stored_indices
 
 
 def run_multiple_experiments(
@@ -72,29 +117,40 @@ def run_multiple_experiments(
     num_events: int = 10,
     target_date: date = None,
     force_rewrite: bool = False,
+    stored_indices: List[int] | None = None,
 ) -> List[ModelInvestmentDecisions]:
-    """Run the same LLM on the same events multiple times."""
+    """Run the same LLM on the same events multiple times.
+
+    stored_indices can pass in a scan from _stored_run_indices that the caller
+    already made, so the run directory is not scanned twice.
+    """
     if target_date is None:
         target_date = date.today()
 
     logger.info(f"Running {num_runs} experiments with {model_info.model_pretty_name}")
 
-    all_results = []
-
-    for run_idx in range(num_runs):
-        # Check if this run already exists
-        if not force_rewrite and check_run_exists(
-            model_info.model_id, target_date, run_idx
-        ):
-            logger.info(
-                f"Run {run_idx + 1}/{num_runs} already exists, loading from cache"
-            )
-            existing_result = load_existing_run(
-                model_info.model_id, target_date, run_idx
+    # Split runs into those already saved on disk and those still to generate
+    if force_rewrite:
+        cached_indices = []
+    elif stored_indices is not None:
+        cached_indices = stored_indices
+    else:
+        cached_indices = _stored_run_indices(model_info.model_id, num_runs, target_date)
+    missing_indices = sorted(set(range(num_runs)) - set(cached_indices))
+
+    results_by_idx: Dict[int, ModelInvestmentDecisions] = {}
+    if cached_indices:
+        logger.info(
+            f"Loading {len(cached_indices)}/{num_runs} existing runs from cache"
+        )
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            cached_results = executor.map(
+                lambda idx: load_existing_run(model_info.model_id, target_date, idx),
+                cached_indices,
             )
-            all_results.append(existing_result)
-            continue
+            results_by_idx.update(zip(cached_indices, cached_results))
 
+    for run_idx in missing_indices:
         logger.info(f"Starting run {run_idx + 1}/{num_runs}")
 
         # Use the same model_info but run with force_rewrite=True to overwrite previous result
@@ -108,20 +164,105 @@ def run_multiple_experiments(
         )
 
         if results:
-            # Move the result to run-specific location
+            # Keep the in-memory result rather than re-reading the saved file
+            results_by_model_id = {result.model_id: result for result in results}
+            results_by_idx[run_idx] = results_by_model_id[model_info.model_id]
+
+            # Move the saved result to run-specific location for future cache hits
             move_result_to_run_location(model_info, target_date, run_idx)
 
-            # Load the result from the new location
-            run_result = load_existing_run(model_info.model_id, target_date, run_idx)
-            all_results.append(run_result)
+    return [results_by_idx[run_idx] for run_idx in sorted(results_by_idx)]
+
+
+class _MarketRow(NamedTuple):
+    market_id: str
+    market_question: str | None
+    estimated_probability: float
+    bet: float
+    confidence: int
+
+
+class _EventRow(NamedTuple):
+    event_id: str
+    event_title: str
+    unallocated_capital: float
+    markets: List[_MarketRow]
 
-    return all_results
+
+@dataclass
+class MarketMetrics:
+    """All individual market decisions across runs, one array per field."""
+
+    estimated_probability: np.ndarray
+    bets: np.ndarray
+    confidence: np.ndarray
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        return {
+            "estimated_probability": self.estimated_probability,
+            "bets": self.bets,
+            "confidence": self.confidence,
+        }
+
+
+def _event_rows_from_results(
+    results_data: List[ModelInvestmentDecisions],
+) -> List[_EventRow]:
+    """Flatten validated runs into the fields used by the metric extraction."""
+    return [
+        _EventRow(
+            event_decision.event_id,
+            event_decision.event_title,
+            event_decision.unallocated_capital,
+            [
+                _MarketRow(
+                    market_decision.market_id,
+                    market_decision.market_question,
+                    market_decision.decision.estimated_probability,
+                    market_decision.decision.bet,
+                    market_decision.decision.confidence,
+                )
+                for market_decision in event_decision.market_investment_decisions
+            ],
+        )
+        for result in results_data
+        for event_decision in result.event_investment_decisions
+    ]
+
+
+def _event_rows_from_file(result_file: Path) -> List[_EventRow]:
+    """Read only the fields used by the metric extraction from a saved run.
+
+    Skips Pydantic validation of the full decisions model, which also carries
+    rationales, returns, sources and timing data not needed for the analysis.
+    """
+    with open(result_file, "rb") as f:
+        data = orjson.loads(f.read())
+
+    return [
+        _EventRow(
+            event["event_id"],
+            event["event_title"],
+            event["unallocated_capital"],
+            [
+                _MarketRow(
+                    market["market_id"],
+                    market.get("market_question"),
+                    market["decision"]["estimated_probability"],
+                    market["decision"]["bet"],
+                    market["decision"]["confidence"],
+                )
+                for market in event["market_investment_decisions"]
+            ],
+        )
+        for event in data["event_investment_decisions"]
+    ]
 
 
 def extract_decision_metrics(
     results_data: List[ModelInvestmentDecisions],
 ) -> Tuple[
-    Dict[str, List[float]],
+    MarketMetrics,
     Dict[str, Dict[str, List[float]]],
     Dict[str, Dict[str, List[float]]],
     Dict[str, List[Dict[str, Any]]],
@@ -134,8 +275,112 @@ def extract_decision_metrics(
         - market_by_event_metrics: Market decisions grouped by event
         - market_details: Detailed market information for analysis
     """
-    # Market-level metrics (all individual market decisions)
-    market_metrics = {"estimated_probability": [], "bets": [], "confidence": []}
+    return _aggregate_event_rows(_event_rows_from_results(results_data))
+
+
+def extract_decision_metrics_from_paths(
+    result_files: List[Path],
+) -> Tuple[
+    MarketMetrics,
+    Dict[str, Dict[str, List[float]]],
+    Dict[str, Dict[str, List[float]]],
+    Dict[str, List[Dict[str, Any]]],
+]:
+    """Extract the same metrics as extract_decision_metrics from saved run files."""
+    return _aggregate_event_rows(
+        [
+            row
+            for result_file in result_files
+            for row in _event_rows_from_file(result_file)
+        ]
+    )
+
+
+# Bump when the extracted metrics change shape or meaning, so cached extractions
+# written by older code are not reused
+_METRICS_CACHE_VERSION = 1
+
+
+def load_or_extract_decision_metrics(
+    result_files: List[Path], cache_dir: Path
+) -> Tuple[
+    MarketMetrics,
+    Dict[str, Dict[str, List[float]]],
+    Dict[str, Dict[str, List[float]]],
+    Dict[str, List[Dict[str, Any]]],
+]:
+    """Extract metrics from saved run files, reusing a cached extraction if fresh.
+
+    The cache is keyed on the extraction version and on the result file paths and
+    their modification times, so rewriting any run invalidates it.
+    """
+    cache_key = hashlib.sha1(
+        f"v{_METRICS_CACHE_VERSION}|".encode()
+        + "".join(
+            f"{result_file}:{result_file.stat().st_mtime_ns}"
+            for result_file in sorted(result_files)
+        ).encode()
+    ).hexdigest()[:16]
+    cache_file = cache_dir / f"decision_metrics_{cache_key}.json"
+
+    if cache_file.exists():
+        logger.info(f"Loading extracted metrics from cache {cache_file}")
+        with open(cache_file, "rb") as f:
+            cached = orjson.loads(f.read())
+        return (
+            MarketMetrics(
+                estimated_probability=np.asarray(
+                    cached["market_metrics"]["estimated_probability"],
+                    dtype=np.float64,
+                ),
+                bets=np.asarray(cached["market_metrics"]["bets"], dtype=np.float64),
+                confidence=np.asarray(
+                    cached["market_metrics"]["confidence"], dtype=np.int64
+                ),
+            ),
+            cached["event_metrics"],
+            cached["market_by_event_metrics"],
+            cached["market_details"],
+        )
+
+    market_metrics, event_metrics, market_by_event_metrics, market_details = (
+        extract_decision_metrics_from_paths(result_files)
+    )
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, "wb") as f:
+        f.write(
+            orjson.dumps(
+                {
+                    "market_metrics": market_metrics.to_dict(),
+                    "event_metrics": event_metrics,
+                    "market_by_event_metrics": market_by_event_metrics,
+                    "market_details": market_details,
+                },
+                option=orjson.OPT_SERIALIZE_NUMPY,
+            )
+        )
+
+    return market_metrics, event_metrics, market_by_event_metrics, market_details
+
+
+def _aggregate_event_rows(
+    event_rows: List[_EventRow],
+) -> Tuple[
+    MarketMetrics,
+    Dict[str, Dict[str, List[float]]],
+    Dict[str, Dict[str, List[float]]],
+    Dict[str, List[Dict[str, Any]]],
+]:
+    # Market-level metrics (all individual market decisions), preallocated to
+    # the total number of market decisions and filled one event slice at a time
+    num_market_decisions = sum(len(event_row.markets) for event_row in event_rows)
+    market_metrics = MarketMetrics(
+        estimated_probability=np.empty(num_market_decisions, dtype=np.float64),
+        bets=np.empty(num_market_decisions, dtype=np.float64),
+        confidence=np.empty(num_market_decisions, dtype=np.int64),
+    )
+    market_idx = 0
 
     # Event-level metrics (aggregated per event)
     event_metrics = {
@@ -148,81 +393,92 @@ def extract_decision_metrics(
     }
 
     # Market decisions grouped by event for consistency analysis
-    market_by_event_metrics = defaultdict(lambda: defaultdict(list))
+    market_by_event_metrics: Dict[str, Dict[str, List[float]]] = {}
 
     # Detailed market information for market-specific analysis
     market_details = defaultdict(list)
 
-    for result in results_data:
-        for event_decision in result.event_investment_decisions:
-            event_id = event_decision.event_id
-
-            total_allocated = 0
-            positive_bets = 0
-            negative_bets = 0
-            bet_magnitudes = []
-
-            # Process each market in this event
-            for market_decision in event_decision.market_investment_decisions:
-                decision = market_decision.decision
-                market_id = market_decision.market_id
-
-                # Collect individual market-level metrics
-                market_metrics["estimated_probability"].append(
-                    decision.estimated_probability
-                )
-                market_metrics["bets"].append(decision.bet)
-                market_metrics["confidence"].append(decision.confidence)
-
-                # Group by event for consistency analysis
-                market_by_event_metrics[event_id]["estimated_probability"].append(
-                    decision.estimated_probability
-                )
-                market_by_event_metrics[event_id]["bets"].append(decision.bet)
-                market_by_event_metrics[event_id]["confidence"].append(
-                    decision.confidence
-                )
-
-                # Store detailed market information
-                market_details[market_id].append(
-                    {
-                        "event_id": event_id,
-                        "event_title": event_decision.event_title,
-                        "market_question": market_decision.market_question,
-                        "estimated_probability": decision.estimated_probability,
-                        "bet": decision.bet,
-                        "confidence": decision.confidence,
-                        "run_index": len(market_details[market_id]),
-                    }
-                )
-
-                # Aggregate for event-level metrics
-                total_allocated += abs(decision.bet)
-                bet_magnitudes.append(abs(decision.bet))
+    for event_row in event_rows:
+        event_id = event_row.event_id
+
+        event_probabilities = []
+        event_bets = []
+        event_confidences = []
+
+        # Process each market in this event
+        for market_row in event_row.markets:
+            market_id = market_row.market_id
+
+            # Collect individual market-level metrics
+            event_probabilities.append(market_row.estimated_probability)
+            event_bets.append(market_row.bet)
+            event_confidences.append(market_row.confidence)
+
+            # Store detailed market information
+            market_details[market_id].append(
+                {
+                    "event_id": event_id,
+                    "event_title": event_row.event_title,
+                    "market_question": market_row.market_question,
+                    "estimated_probability": market_row.estimated_probability,
+                    "bet": market_row.bet,
+                    "confidence": market_row.confidence,
+                    "run_index": len(market_details[market_id]),
+                }
+            )
 
-                if decision.bet > 0:
-                    positive_bets += 1
-                elif decision.bet < 0:
-                    negative_bets += 1
+        # Group by event for consistency analysis, one extend per metric
+        if event_row.markets:
+            if event_id not in market_by_event_metrics:
+                market_by_event_metrics[event_id] = {
+                    "estimated_probability": [],
+                    "bets": [],
+                    "confidence": [],
+                }
+            event_markets = market_by_event_metrics[event_id]
+            event_markets["estimated_probability"].extend(event_probabilities)
+            event_markets["bets"].extend(event_bets)
+            event_markets["confidence"].extend(event_confidences)
+
+        event_slice = slice(market_idx, market_idx + len(event_bets))
+        market_metrics.estimated_probability[event_slice] = event_probabilities
+        market_metrics.bets[event_slice] = event_bets
+        market_metrics.confidence[event_slice] = event_confidences
+        market_idx = event_slice.stop
+
+        event_metrics["unallocated_capital"].append(event_row.unallocated_capital)
+        event_metrics["num_markets_per_event"].append(len(event_row.markets))
+
+    # Aggregate every event's bets at once: each market decision carries the
+    # index of its event, so per-event sums and sign counts are bincounts over
+    # the flat bets instead of several reductions per event
+    num_events = len(event_rows)
+    markets_per_event = np.asarray(
+        event_metrics["num_markets_per_event"], dtype=np.intp
+    )
+    event_idx = np.repeat(np.arange(num_events), markets_per_event)
+    bets_array = market_metrics.bets
+    total_allocated = np.bincount(
+        event_idx, weights=np.abs(bets_array), minlength=num_events
+    )
+    num_positive_bets = np.bincount(event_idx[bets_array > 0], minlength=num_events)
+    num_negative_bets = np.bincount(event_idx[bets_array < 0], minlength=num_events)
+    avg_bet_magnitude = np.divide(
+        total_allocated,
+        markets_per_event,
+        out=np.zeros(num_events),
+        where=markets_per_event > 0,
+    )
 
-            # Store event-level aggregated metrics
-            event_metrics["total_allocated"].append(total_allocated)
-            event_metrics["unallocated_capital"].append(
-                event_decision.unallocated_capital
-            )
-            event_metrics["num_positive_bets"].append(positive_bets)
-            event_metrics["num_negative_bets"].append(negative_bets)
-            event_metrics["avg_bet_magnitude"].append(
-                np.mean(bet_magnitudes) if bet_magnitudes else 0
-            )
-            event_metrics["num_markets_per_event"].append(
-                len(event_decision.market_investment_decisions)
-            )
+    event_metrics["total_allocated"] = total_allocated.tolist()
+    event_metrics["num_positive_bets"] = num_positive_bets.tolist()
+    event_metrics["num_negative_bets"] = num_negative_bets.tolist()
+    event_metrics["avg_bet_magnitude"] = avg_bet_magnitude.tolist()
 
     return (
         market_metrics,
         event_metrics,
-        dict(market_by_event_metrics),
+        market_by_event_metrics,
         dict(market_details),
     )
 
@@ -240,84 +496,144 @@ class Stats(BaseModel):
     kurtosis: float
 
 
+def _describe(arr: np.ndarray) -> Stats:
+    """Compute the statistics of one metric array."""
+    std = arr.std()
+    # Order statistics from a single quantile pass
+    q_min, q25, median, q75, q_max = np.quantile(arr, [0.0, 0.25, 0.5, 0.75, 1.0])
+    return Stats(
+        mean=arr.mean(),
+        std=std,
+        min=q_min,
+        max=q_max,
+        median=median,
+        q25=q25,
+        q75=q75,
+        variance=std * std,
+        skew=calculate_skew(arr),
+        kurtosis=calculate_kurtosis(arr),
+    )
+
+
 def calculate_statistics(
-    metrics: Dict[str, List[float]],
+    metrics: Dict[str, List[float] | np.ndarray],
 ) -> Dict[str, Stats]:
     """Calculate descriptive statistics for each metric."""
     stats = {}
 
     for metric_name, values in metrics.items():
-        if not values:
+        if len(values) == 0:
             continue
-
-        stats[metric_name] = Stats(
-            mean=np.mean(values),
-            std=np.std(values),
-            min=np.min(values),
-            max=np.max(values),
-            median=np.median(values),
-            q25=np.percentile(values, 25),
-            q75=np.percentile(values, 75),
-            variance=np.var(values),
-            skew=calculate_skew(values),
-            kurtosis=calculate_kurtosis(values),
-        )
+        stats[metric_name] = _describe(np.asarray(values, dtype=np.float64))
 
     return stats
 
 
-def calculate_skew(values: List[float]) -> float:
+def calculate_skew(values: List[float] | np.ndarray) -> float:
     """Calculate skew of the distribution."""
-    if len(values) < 3:
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size < 3:
         return 0.0
-    mean = np.mean(values)
-    std = np.std(values)
+    std = arr.std()
     if std == 0:
         return 0.0
-    return np.mean([(x - mean) / std for x in values]) ** 3
+    centered = (arr - arr.mean()) / std
+    return float((centered**3).mean())
 
 
-def calculate_kurtosis(values: List[float]) -> float:
+def calculate_kurtosis(values: List[float] | np.ndarray) -> float:
     """Calculate kurtosis of the distribution."""
-    if len(values) < 4:
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size < 4:
         return 0.0
-    mean = np.mean(values)
-    std = np.std(values)
+    std = arr.std()
     if std == 0:
         return 0.0
-    return np.mean([(x - mean) / std for x in values]) ** 4 - 3
+    centered = (arr - arr.mean()) / std
+    return float((centered**4).mean() - 3)
+
+
+# Short / no position / long, indexed by the sign of the bet
+_POSITION_CMAP = ListedColormap(["red", "gray", "green"])
+
+_REUSABLE_FIGURES: Dict[Tuple[int, int, Tuple[float, float]], plt.Figure] = {}
+
+
+def _reusable_subplots(
+    nrows: int, ncols: int, figsize: Tuple[float, float]
+) -> Tuple[plt.Figure, np.ndarray]:
+    """Return a cleared figure and axes grid, keeping one figure per grid shape and size."""
+    key = (nrows, ncols, tuple(figsize))
+    fig = _REUSABLE_FIGURES.get(key)
+    if fig is None:
+        fig = plt.figure(figsize=figsize, constrained_layout=True)
+        _REUSABLE_FIGURES[key] = fig
+    else:
+        fig.clf()
+    return fig, fig.subplots(nrows, ncols)
+
+
+def _close_reusable_figures() -> None:
+    """Close the figures kept by _reusable_subplots once plotting is done."""
+    for fig in _REUSABLE_FIGURES.values():
+        plt.close(fig)
+    _REUSABLE_FIGURES.clear()
+
+
+def _analysis_figure(
+    title: str,
+    nrows: int = 2,
+    ncols: int = 2,
+    figsize: Tuple[float, float] = (15, 10),
+) -> Tuple[plt.Figure, np.ndarray]:
+    """Return a titled analysis figure, using the shared grid layout by default."""
+    fig, axes = _reusable_subplots(nrows, ncols, figsize=figsize)
+    fig.suptitle(title, fontsize=16, fontweight="bold")
+    return fig, axes
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two equal-length arrays (NaN if either is constant)."""
+    x_centered = x - x.mean()
+    y_centered = y - y.mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return float(
+            (x_centered @ y_centered)
+            / np.sqrt((x_centered @ x_centered) * (y_centered @ y_centered))
+        )
+
+
+def _truncate_label(text: str, max_length: int) -> str:
+    """Shorten a market question or event title for use as a plot label."""
+    return text[:max_length] + "..." if len(text) > max_length else text
 
 
 def create_market_behavior_overview(
-    market_metrics: Dict[str, List[float]], model_name: str, output_dir: Path
+    market_metrics: MarketMetrics, model_name: str, output_dir: Path
 ):
     """Create overview of market-level decision patterns."""
-    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-    fig.suptitle(
-        f"Market Decision Patterns: {model_name}", fontsize=16, fontweight="bold"
-    )
+    fig, axes = _analysis_figure(f"Market Decision Patterns: {model_name}")
 
     # Estimated probability distribution
     ax = axes[0, 0]
-    if (
-        "estimated_probability" in market_metrics
-        and market_metrics["estimated_probability"]
-    ):
-        values = market_metrics["estimated_probability"]
+    if market_metrics.estimated_probability.size:
+        values = market_metrics.estimated_probability
+        mean_value = float(values.mean())
+        median_value = float(np.median(values))
         ax.hist(values, bins=30, alpha=0.7, edgecolor="black", color="skyblue")
         ax.axvline(
-            np.mean(values),
+            mean_value,
             color="red",
             linestyle="--",
             linewidth=2,
-            label=f"Mean: {np.mean(values):.2f}",
+            label=f"Mean: {mean_value:.2f}",
         )
         ax.axvline(
-            np.median(values),
+            median_value,
             color="orange",
             linestyle="--",
             linewidth=2,
-            label=f"Median: {np.median(values):.2f}",
+            label=f"Median: {median_value:.2f}",
         )
         ax.set_title("Market Estimated Probabilities")
         ax.set_xlabel("Estimated Probability")
@@ -327,16 +643,17 @@ def create_market_behavior_overview(
 
     # Bet amount distribution
     ax = axes[0, 1]
-    if "bets" in market_metrics and market_metrics["bets"]:
-        values = market_metrics["bets"]
+    if market_metrics.bets.size:
+        values = market_metrics.bets
+        mean_value = float(values.mean())
         ax.hist(values, bins=30, alpha=0.7, edgecolor="black", color="lightgreen")
         ax.axvline(0, color="black", linestyle="-", linewidth=1, alpha=0.5)
         ax.axvline(
-            np.mean(values),
+            mean_value,
             color="red",
             linestyle="--",
             linewidth=2,
-            label=f"Mean: {np.mean(values):.2f}",
+            label=f"Mean: {mean_value:.2f}",
         )
         ax.set_title("Market Bet Amounts")
         ax.set_xlabel("Bet Amount")
@@ -346,15 +663,16 @@ def create_market_behavior_overview(
 
     # Confidence distribution
     ax = axes[1, 0]
-    if "confidence" in market_metrics and market_metrics["confidence"]:
-        values = market_metrics["confidence"]
+    if market_metrics.confidence.size:
+        values = market_metrics.confidence
+        mean_value = float(values.mean())
         ax.hist(values, bins=20, alpha=0.7, edgecolor="black", color="lightcoral")
         ax.axvline(
-            np.mean(values),
+            mean_value,
             color="red",
             linestyle="--",
             linewidth=2,
-            label=f"Mean: {np.mean(values):.2f}",
+            label=f"Mean: {mean_value:.2f}",
         )
         ax.set_title("Market Confidence Levels")
         ax.set_xlabel("Confidence")
@@ -364,46 +682,42 @@ def create_market_behavior_overview(
 
     # Bet magnitude vs confidence scatter
     ax = axes[1, 1]
-    if (
-        "bets" in market_metrics
-        and "confidence" in market_metrics
-        and len(market_metrics["bets"]) == len(market_metrics["confidence"])
-    ):
-        bet_magnitudes = [abs(bet) for bet in market_metrics["bets"]]
-        ax.scatter(market_metrics["confidence"], bet_magnitudes, alpha=0.6, s=30)
+    if market_metrics.bets.size:
+        bet_magnitudes = np.abs(market_metrics.bets)
+        ax.scatter(
+            market_metrics.confidence,
+            bet_magnitudes,
+            alpha=0.6,
+            s=30,
+            rasterized=True,
+        )
         ax.set_xlabel("Confidence")
         ax.set_ylabel("Bet Magnitude (Absolute)")
         ax.set_title("Confidence vs Bet Magnitude")
         ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(
-        output_dir / "market_behavior_overview.png", dpi=300, bbox_inches="tight"
-    )
-    plt.close()
+    fig.savefig(output_dir / "market_behavior_overview.png", dpi=300)
 
 
 def create_probability_bet_analysis(
-    market_metrics: Dict[str, List[float]], model_name: str, output_dir: Path
+    market_metrics: MarketMetrics, model_name: str, output_dir: Path
 ):
     """Create detailed analysis of probability estimates vs betting behavior."""
-    if "bets" not in market_metrics or not market_metrics["bets"]:
+    if not market_metrics.bets.size:
         return
 
-    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-    fig.suptitle(
-        f"Probability vs Betting Analysis: {model_name}", fontsize=16, fontweight="bold"
-    )
+    fig, axes = _analysis_figure(f"Probability vs Betting Analysis: {model_name}")
 
-    bets = np.array(market_metrics["bets"])
+    bets = market_metrics.bets
+    bet_magnitudes = np.abs(bets)
 
     # Bet direction pie chart
     ax = axes[0, 0]
-    positive_bets = bets[bets > 0]
-    negative_bets = bets[bets < 0]
-    zero_bets = bets[bets == 0]
-
-    sizes = [len(positive_bets), len(negative_bets), len(zero_bets)]
+    sizes = [
+        np.count_nonzero(bets > 0),
+        np.count_nonzero(bets < 0),
+        np.count_nonzero(bets == 0),
+    ]
     labels = ["Long Positions", "Short Positions", "No Position"]
     colors = ["#2E8B57", "#DC143C", "#696969"]
 
@@ -423,16 +737,17 @@ def create_probability_bet_analysis(
 
     # Probability vs bet scatter with color coding
     ax = axes[0, 1]
-    if "estimated_probability" in market_metrics and len(
-        market_metrics["estimated_probability"]
-    ) == len(market_metrics["bets"]):
-        colors = ["red" if bet < 0 else "green" if bet > 0 else "gray" for bet in bets]
+    if market_metrics.estimated_probability.size == bets.size:
         ax.scatter(
-            market_metrics["estimated_probability"],
-            market_metrics["bets"],
+            market_metrics.estimated_probability,
+            bets,
             alpha=0.6,
-            c=colors,
+            c=np.sign(bets),
+            cmap=_POSITION_CMAP,
+            vmin=-1,
+            vmax=1,
             s=30,
+            rasterized=True,
         )
         ax.set_xlabel("Estimated Probability")
         ax.set_ylabel("Bet Amount")
@@ -476,13 +791,14 @@ def create_probability_bet_analysis(
 
     # Bet magnitude by probability bins
     ax = axes[1, 0]
-    if "estimated_probability" in market_metrics:
+    if market_metrics.estimated_probability.size == bets.size:
         bin_labels = ["0-20%", "20-40%", "40-60%", "60-80%", "80-100%"]
-        bet_magnitudes_by_bin = [[] for _ in range(len(bin_labels))]
-
-        for prob, bet in zip(market_metrics["estimated_probability"], bets):
-            bin_idx = min(int(prob * 5), 4)  # Ensure we don't exceed bin count
-            bet_magnitudes_by_bin[bin_idx].append(abs(bet))
+        probabilities = market_metrics.estimated_probability
+        # Ensure we don't exceed bin count
+        bin_idx = np.minimum((probabilities * 5).astype(np.intp), 4)
+        bet_magnitudes_by_bin = [
+            bet_magnitudes[bin_idx == i].tolist() for i in range(len(bin_labels))
+        ]
 
         # Filter out empty bins
         non_empty_bins = [
@@ -503,31 +819,27 @@ def create_probability_bet_analysis(
     # Confidence vs bet magnitude with probability color coding
     ax = axes[1, 1]
     if (
-        "confidence" in market_metrics
-        and "estimated_probability" in market_metrics
-        and len(market_metrics["confidence"])
-        == len(bets)
-        == len(market_metrics["estimated_probability"])
+        market_metrics.confidence.size
+        == bets.size
+        == market_metrics.estimated_probability.size
     ):
-        bet_magnitudes = [abs(bet) for bet in bets]
         scatter = ax.scatter(
-            market_metrics["confidence"],
+            market_metrics.confidence,
             bet_magnitudes,
-            c=market_metrics["estimated_probability"],
+            c=market_metrics.estimated_probability,
             cmap="viridis",
             alpha=0.6,
             s=30,
+            rasterized=True,
         )
         ax.set_xlabel("Confidence")
         ax.set_ylabel("Bet Magnitude (Absolute)")
         ax.set_title("Confidence vs Bet Magnitude\n(Color = Estimated Probability)")
         ax.grid(True, alpha=0.3)
-        cbar = plt.colorbar(scatter, ax=ax)
+        cbar = fig.colorbar(scatter, ax=ax)
         cbar.set_label("Estimated Probability")
 
-    plt.tight_layout()
-    plt.savefig(output_dir / "prob_vs_bet.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(output_dir / "prob_vs_bet.png", dpi=300)
 
 
 def create_market_consistency_analysis(
@@ -548,36 +860,31 @@ def create_market_consistency_analysis(
         return
 
     # Limit to most frequently appearing markets
-    market_ids_sorted = sorted(
-        multi_run_markets.keys(), key=lambda x: len(multi_run_markets[x]), reverse=True
+    top_markets = heapq.nlargest(
+        6, multi_run_markets.keys(), key=lambda x: len(multi_run_markets[x])
     )
-    top_markets = market_ids_sorted[: min(6, len(market_ids_sorted))]
 
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-    fig.suptitle(
+    # Use the actual market questions for the labels, truncated for readability
+    market_names = [
+        _truncate_label(multi_run_markets[market_id][0]["market_question"], 25)
+        for market_id in top_markets
+    ]
+
+    fig, axes = _analysis_figure(
         f"Market Decision Consistency Across Runs: {model_name}",
-        fontsize=16,
-        fontweight="bold",
+        ncols=3,
+        figsize=(18, 12),
     )
 
     # Probability consistency by market
     ax = axes[0, 0]
     prob_consistency = []
-    market_names = []
     for market_id in top_markets:
         market_data = multi_run_markets[market_id]
         probs = [d["estimated_probability"] for d in market_data]
         if len(probs) > 1:
             cv = np.std(probs) / np.mean(probs) if np.mean(probs) != 0 else 0
             prob_consistency.append(cv)
-            # Use the actual market question for the label, truncated for readability
-            market_question = market_data[0]["market_question"]
-            truncated_question = (
-                market_question[:25] + "..."
-                if len(market_question) > 25
-                else market_question
-            )
-            market_names.append(truncated_question)
 
     if prob_consistency:
         bars = ax.bar(
@@ -608,13 +915,10 @@ def create_market_consistency_analysis(
         market_data = multi_run_markets[market_id]
         bets = [d["bet"] for d in market_data]
         if len(bets) > 1:
-            signs = [1 if bet > 0 else -1 if bet < 0 else 0 for bet in bets]
+            signs = np.sign(np.asarray(bets, dtype=np.float64)).astype(np.int8)
             # Calculate the proportion of the most common sign
-            from collections import Counter
-
-            sign_counts = Counter(signs)
-            most_common_count = sign_counts.most_common(1)[0][1]
-            consistency = most_common_count / len(signs)
+            _, sign_counts = np.unique(signs, return_counts=True)
+            consistency = sign_counts.max() / signs.size
             direction_consistency.append(consistency)
 
     if direction_consistency:
@@ -720,12 +1024,7 @@ def create_market_consistency_analysis(
             ax2.set_ylabel("Bet Amount", color="red")
 
             # Use actual market question for title, truncated
-            market_question = market_data[0]["market_question"]
-            truncated_question = (
-                market_question[:30] + "..."
-                if len(market_question) > 30
-                else market_question
-            )
+            truncated_question = _truncate_label(market_data[0]["market_question"], 30)
             ax.set_title(f"{truncated_question}\nDecision Pattern", fontsize=10)
 
             # Add horizontal line at zero for bets
@@ -738,9 +1037,7 @@ def create_market_consistency_analysis(
 
             ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(output_dir / "market_consistency.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(output_dir / "market_consistency.png", dpi=300)
 
 
 def create_within_event_structure_analysis(
@@ -774,10 +1071,7 @@ def create_within_event_structure_analysis(
     if len(multi_market_events) == 0:
         return
 
-    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-    fig.suptitle(
-        f"Within-Event Market Structure: {model_name}", fontsize=16, fontweight="bold"
-    )
+    fig, axes = _analysis_figure(f"Within-Event Market Structure: {model_name}")
 
     # Probability spread within events
     ax = axes[0, 0]
@@ -791,9 +1085,7 @@ def create_within_event_structure_analysis(
             prob_spreads.append(spread)
             # Use actual event title, truncated for readability
             event_title = event_titles.get(event_id, f"Event {event_id}")
-            truncated_title = (
-                event_title[:20] + "..." if len(event_title) > 20 else event_title
-            )
+            truncated_title = _truncate_label(event_title, 20)
             event_labels.append(truncated_title)
 
     if prob_spreads:
@@ -822,20 +1114,36 @@ def create_within_event_structure_analysis(
     ax = axes[0, 1]
     allocation_imbalances = []
     allocation_event_labels = []
-    for event_id, data in multi_market_events.items():
-        if "bets" in data and len(data["bets"]) > 1:
-            bets = np.array(data["bets"])
-            total_long = np.sum(bets[bets > 0])
-            total_short = abs(np.sum(bets[bets < 0]))
-            total_exposure = total_long + total_short
-            if total_exposure > 0:
-                imbalance = abs(total_long - total_short) / total_exposure
+    bet_event_ids = [
+        event_id
+        for event_id, data in multi_market_events.items()
+        if "bets" in data and len(data["bets"]) > 1
+    ]
+    if bet_event_ids:
+        # Pack all events' bets into one array and sum long/short exposure per event
+        bets_per_event = [multi_market_events[eid]["bets"] for eid in bet_event_ids]
+        bets_flat = np.concatenate(bets_per_event).astype(np.float64)
+        event_idx = np.repeat(
+            np.arange(len(bet_event_ids)), [len(bets) for bets in bets_per_event]
+        )
+        total_long = np.bincount(
+            event_idx, weights=np.maximum(bets_flat, 0.0), minlength=len(bet_event_ids)
+        )
+        total_short = np.bincount(
+            event_idx, weights=np.maximum(-bets_flat, 0.0), minlength=len(bet_event_ids)
+        )
+        total_exposure = total_long + total_short
+        imbalances = np.abs(total_long - total_short) / np.where(
+            total_exposure > 0, total_exposure, 1.0
+        )
+        for event_id, imbalance, exposure in zip(
+            bet_event_ids, imbalances, total_exposure
+        ):
+            if exposure > 0:
                 allocation_imbalances.append(imbalance)
                 # Use actual event title, truncated for readability
                 event_title = event_titles.get(event_id, f"Event {event_id}")
-                truncated_title = (
-                    event_title[:15] + "..." if len(event_title) > 15 else event_title
-                )
+                truncated_title = _truncate_label(event_title, 15)
                 allocation_event_labels.append(truncated_title)
 
     if allocation_imbalances:
@@ -871,8 +1179,7 @@ def create_within_event_structure_analysis(
         for data in multi_market_events.values()
     ]
     if market_counts:
-        unique_counts = sorted(set(market_counts))
-        count_frequencies = [market_counts.count(c) for c in unique_counts]
+        unique_counts, count_frequencies = np.unique(market_counts, return_counts=True)
         bars = ax.bar(
             unique_counts, count_frequencies, alpha=0.7, color="lightgreen", width=0.6
         )
@@ -906,11 +1213,10 @@ def create_within_event_structure_analysis(
             and len(data["estimated_probability"]) > 1
         ):
             # Use coefficient of variation as measure of probability diversity
+            probabilities = np.asarray(data["estimated_probability"], dtype=np.float64)
+            mean_probability = probabilities.mean()
             prob_cv = (
-                np.std(data["estimated_probability"])
-                / np.mean(data["estimated_probability"])
-                if np.mean(data["estimated_probability"]) != 0
-                else 0
+                probabilities.std() / mean_probability if mean_probability != 0 else 0
             )
             avg_conf = np.mean(data["confidence"])
             prob_diversity.append(prob_cv)
@@ -925,45 +1231,54 @@ def create_within_event_structure_analysis(
 
         # Add trend line if we have enough points
         if len(prob_diversity) > 2:
-            z = np.polyfit(prob_diversity, avg_confidence, 1)
-            p = np.poly1d(z)
-            ax.plot(prob_diversity, p(prob_diversity), "r--", alpha=0.8, linewidth=2)
+            diversity = np.asarray(prob_diversity, dtype=np.float64)
+            order = np.argsort(diversity)
+            sorted_diversity = diversity[order]
+            coeffs = np.polynomial.polynomial.polyfit(
+                sorted_diversity, np.asarray(avg_confidence)[order], 1
+            )
+            ax.plot(
+                sorted_diversity,
+                np.polynomial.polynomial.polyval(sorted_diversity, coeffs),
+                "r--",
+                alpha=0.8,
+                linewidth=2,
+            )
 
-    plt.tight_layout()
-    plt.savefig(output_dir / "within_event_structure.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(output_dir / "within_event_structure.png", dpi=300)
 
 
 def create_confidence_vs_bet_analysis(
-    market_metrics: Dict[str, List[float]], model_name: str, output_dir: Path
+    market_metrics: MarketMetrics, model_name: str, output_dir: Path
 ):
     """Create detailed analysis of confidence patterns and their relationship to betting behavior."""
-    if "confidence" not in market_metrics or not market_metrics["confidence"]:
+    if not market_metrics.confidence.size:
         return
 
-    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-    fig.suptitle(
-        f"Confidence vs Betting Behavior: {model_name}", fontsize=16, fontweight="bold"
-    )
+    fig, axes = _analysis_figure(f"Confidence vs Betting Behavior: {model_name}")
 
-    confidence_vals = market_metrics["confidence"]
+    # Float views of the metrics shared by every panel below
+    confidence_vals = market_metrics.confidence.astype(np.float64)
+    bet_magnitudes = np.abs(market_metrics.bets)
+    mean_confidence = confidence_vals.mean()
+    median_confidence = np.median(confidence_vals)
 
     # Confidence distribution
     ax = axes[0, 0]
     ax.hist(confidence_vals, bins=20, alpha=0.7, edgecolor="black", color="lightcoral")
     ax.axvline(
-        np.mean(confidence_vals),
+        mean_confidence,
         color="red",
         linestyle="--",
         linewidth=2,
-        label=f"Mean: {np.mean(confidence_vals):.2f}",
+        label=f"Mean: {mean_confidence:.2f}",
     )
     ax.axvline(
-        np.median(confidence_vals),
+        median_confidence,
         color="orange",
         linestyle="--",
         linewidth=2,
-        label=f"Median: {np.median(confidence_vals):.2f}",
+        label=f"Median: {median_confidence:.2f}",
     )
     ax.set_title("Confidence Distribution")
     ax.set_xlabel("Confidence Level")
@@ -973,16 +1288,22 @@ def create_confidence_vs_bet_analysis(
 
     # Confidence vs Bet Magnitude
     ax = axes[0, 1]
-    if "bets" in market_metrics and len(market_metrics["bets"]) == len(confidence_vals):
-        bet_magnitudes = [abs(bet) for bet in market_metrics["bets"]]
-        ax.scatter(confidence_vals, bet_magnitudes, alpha=0.6, s=30, color="blue")
+    if market_metrics.bets.size == confidence_vals.size:
+        ax.scatter(
+            confidence_vals,
+            bet_magnitudes,
+            alpha=0.6,
+            s=30,
+            color="blue",
+            rasterized=True,
+        )
         ax.set_xlabel("Confidence")
         ax.set_ylabel("Bet Magnitude")
         ax.set_title("Confidence vs Bet Magnitude")
         ax.grid(True, alpha=0.3)
 
         # Add correlation coefficient
-        correlation = np.corrcoef(confidence_vals, bet_magnitudes)[0, 1]
+        correlation = _pearson(confidence_vals, bet_magnitudes)
         ax.text(
             0.05,
             0.95,
@@ -993,33 +1314,27 @@ def create_confidence_vs_bet_analysis(
 
     # Confidence bins vs Bet Direction
     ax = axes[1, 0]
-    if "bets" in market_metrics and len(market_metrics["bets"]) == len(confidence_vals):
-        # Create confidence bins
-        conf_bins = np.linspace(min(confidence_vals), max(confidence_vals), 6)
+    if market_metrics.bets.size == confidence_vals.size:
+        # Create confidence bins from a single min/max reduction
+        conf_min = confidence_vals.min()
+        conf_max = confidence_vals.max()
+        conf_span = conf_max - conf_min
+        conf_bins = np.linspace(conf_min, conf_max, 6)
         bin_labels = [
-            f"{conf_bins[i]:.1f}-{conf_bins[i + 1]:.1f}"
-            for i in range(len(conf_bins) - 1)
+            f"{lower:.1f}-{upper:.1f}" for lower, upper in zip(conf_bins, conf_bins[1:])
         ]
 
-        long_counts = [0] * (len(conf_bins) - 1)
-        short_counts = [0] * (len(conf_bins) - 1)
-        no_bet_counts = [0] * (len(conf_bins) - 1)
-
-        for conf, bet in zip(confidence_vals, market_metrics["bets"]):
-            bin_idx = min(
-                int(
-                    (conf - min(confidence_vals))
-                    / (max(confidence_vals) - min(confidence_vals))
-                    * 5
-                ),
-                4,
-            )
-            if bet > 0:
-                long_counts[bin_idx] += 1
-            elif bet < 0:
-                short_counts[bin_idx] += 1
-            else:
-                no_bet_counts[bin_idx] += 1
+        # Assign every decision to its confidence bin, then count each position
+        # type per bin
+        num_bins = len(bin_labels)
+        scaled_confidence = (confidence_vals - conf_min) / (conf_span or 1)
+        bin_idx = np.minimum(
+            (scaled_confidence * num_bins).astype(np.intp), num_bins - 1
+        )
+        bets = market_metrics.bets
+        long_counts = np.bincount(bin_idx[bets > 0], minlength=num_bins)
+        short_counts = np.bincount(bin_idx[bets < 0], minlength=num_bins)
+        no_bet_counts = np.bincount(bin_idx[bets == 0], minlength=num_bins)
 
         x = np.arange(len(bin_labels))
         width = 0.25
@@ -1052,25 +1367,18 @@ def create_confidence_vs_bet_analysis(
 
     # Confidence vs Estimated Probability
     ax = axes[1, 1]
-    if "estimated_probability" in market_metrics and len(
-        market_metrics["estimated_probability"]
-    ) == len(confidence_vals):
+    if market_metrics.estimated_probability.size == confidence_vals.size:
         # Color code by bet direction
-        colors = (
-            [
-                "red" if bet < 0 else "green" if bet > 0 else "gray"
-                for bet in market_metrics["bets"]
-            ]
-            if "bets" in market_metrics
-            else ["blue"] * len(confidence_vals)
-        )
-
         ax.scatter(
-            market_metrics["estimated_probability"],
+            market_metrics.estimated_probability,
             confidence_vals,
-            c=colors,
+            c=np.sign(market_metrics.bets),
+            cmap=_POSITION_CMAP,
+            vmin=-1,
+            vmax=1,
             alpha=0.6,
             s=30,
+            rasterized=True,
         )
         ax.set_xlabel("Estimated Probability")
         ax.set_ylabel("Confidence")
@@ -1086,9 +1394,7 @@ def create_confidence_vs_bet_analysis(
         ax.legend(handles=[green_patch, red_patch, gray_patch], loc="upper right")
 
         # Add correlation coefficient
-        correlation = np.corrcoef(
-            market_metrics["estimated_probability"], confidence_vals
-        )[0, 1]
+        correlation = _pearson(market_metrics.estimated_probability, confidence_vals)
         ax.text(
             0.05,
             0.95,
@@ -1097,14 +1403,12 @@ def create_confidence_vs_bet_analysis(
             bbox=dict(boxstyle="round", facecolor="white", alpha=0.8),
         )
 
-    plt.tight_layout()
-    plt.savefig(output_dir / "confidence_vs_bet.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(output_dir / "confidence_vs_bet.png", dpi=300)
 
 
 def save_results(
     results_data: List[ModelInvestmentDecisions],
-    market_metrics: Dict[str, List[float]],
+    market_metrics: MarketMetrics,
     event_metrics: Dict[str, List[float]],
     market_details: Dict[str, List[Dict[str, Any]]],
     market_stats: Dict[str, Dict[str, float]],
@@ -1116,115 +1420,106 @@ def save_results(
         output_dir = Path("llm_distribution_analysis")
     output_dir.mkdir(exist_ok=True)
 
-    # Save raw results
-    raw_results = []
-    for result in results_data:
-        raw_results.append(result.model_dump())
-
-    with open(output_dir / "raw_results.json", "w") as f:
-        json.dump(raw_results, f, indent=2, default=str)
-
-    # Save market-level metrics and statistics
-    with open(output_dir / "market_metrics.json", "w") as f:
-        json.dump(market_metrics, f, indent=2, default=str)
+    # Raw results, streamed one model run per line; the live model client is
+    # excluded as when runs are saved
+    with open(output_dir / "raw_results.ndjson", "w") as f:
+        for result in results_data:
+            f.write(result.model_dump_json(exclude={"model_info": {"client"}}))
+            f.write("\n")
+
+    outputs = {
+        # Market-level metrics and statistics
+        "market_metrics.json": market_metrics.to_dict(),
+        "market_statistics.json": market_stats,
+        # Event-level metrics and statistics
+        "event_metrics.json": event_metrics,
+        "event_statistics.json": event_stats,
+        # Market details
+        "market_details.json": market_details,
+    }
+    for filename, data in outputs.items():
+        with open(output_dir / filename, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                    default=str,
+                )
+            )
 
-    with open(output_dir / "market_statistics.json", "w") as f:
-        json.dump(market_stats, f, indent=2, default=str)
+    logger.info(f"Results saved to {output_dir}")
 
-    # Save event-level metrics and statistics
-    with open(output_dir / "event_metrics.json", "w") as f:
-        json.dump(event_metrics, f, indent=2, default=str)
 
-    with open(output_dir / "event_statistics.json", "w") as f:
-        json.dump(event_stats, f, indent=2, default=str)
+def _metric_display_lines(display_name: str, metric_stats: Stats):
+    yield ""
+    yield f"{display_name}:"
+    yield f"  Mean: {metric_stats.mean:.3f}"
+    yield f"  Std Dev: {metric_stats.std:.3f}"
+    yield f"  Range: [{metric_stats.min:.3f}, {metric_stats.max:.3f}]"
+    yield f"  Median: {metric_stats.median:.3f}"
 
-    # Save market details
-    with open(output_dir / "market_details.json", "w") as f:
-        json.dump(market_details, f, indent=2, default=str)
 
-    logger.info(f"Results saved to {output_dir}")
+def _market_display_name(metric_name: str) -> str:
+    return (
+        "Predicted Probability"
+        if metric_name == "estimated_probability"
+        else metric_name.title()
+    )
 
 
-def create_summary_report(
-    market_stats: Dict[str, Dict[str, float]],
-    event_stats: Dict[str, Dict[str, float]],
+def _iter_report_lines(
+    market_stats: Dict[str, Stats],
+    event_stats: Dict[str, Stats],
     model_info: ModelInfo,
     num_runs: int,
     num_events: int,
     num_market_decisions: int,
     num_unique_markets: int,
-    output_dir: Path,
 ):
-    """Create a human-readable summary report."""
-    report_lines = [
-        "LLM Distribution Analysis Report",
-        "=" * 50,
-        "",
-        f"Model: {model_info.model_pretty_name}",
-        f"Provider: {model_info.company_pretty_name}",
-        f"Number of runs: {num_runs}",
-        f"Number of events per run: {num_events}",
-        f"Total market decisions analyzed: {num_market_decisions}",
-        f"Unique markets: {num_unique_markets}",
-        "",
-        "MARKET-LEVEL ANALYSIS:",
-        "=" * 30,
-    ]
+    """Yield the lines of the summary report in order."""
+    yield "LLM Distribution Analysis Report"
+    yield "=" * 50
+    yield ""
+    yield f"Model: {model_info.model_pretty_name}"
+    yield f"Provider: {model_info.company_pretty_name}"
+    yield f"Number of runs: {num_runs}"
+    yield f"Number of events per run: {num_events}"
+    yield f"Total market decisions analyzed: {num_market_decisions}"
+    yield f"Unique markets: {num_unique_markets}"
+    yield ""
+    yield "MARKET-LEVEL ANALYSIS:"
+    yield "=" * 30
 
     # Add market-level statistics
     for metric_name, metric_stats in market_stats.items():
         if metric_name in ["estimated_probability", "bets", "confidence"]:
-            display_name = (
-                "Predicted Probability"
-                if metric_name == "estimated_probability"
-                else metric_name.title()
-            )
-            report_lines.extend(
-                [
-                    "",
-                    f"{display_name}:",
-                    f"  Mean: {metric_stats['mean']:.3f}",
-                    f"  Std Dev: {metric_stats['std']:.3f}",
-                    f"  Range: [{metric_stats['min']:.3f}, {metric_stats['max']:.3f}]",
-                    f"  Median: {metric_stats['median']:.3f}",
-                ]
+            yield from _metric_display_lines(
+                _market_display_name(metric_name), metric_stats
             )
 
     # Add market-level consistency analysis
-    report_lines.extend(
-        [
-            "",
-            "Market-Level Consistency Analysis:",
-            "-" * 30,
-        ]
-    )
+    yield ""
+    yield "Market-Level Consistency Analysis:"
+    yield "-" * 30
 
     for metric_name in ["estimated_probability", "bets", "confidence"]:
         if metric_name in market_stats:
+            metric_stats = market_stats[metric_name]
             cv = (
-                market_stats[metric_name]["std"]
-                / abs(market_stats[metric_name]["mean"])
-                if market_stats[metric_name]["mean"] != 0
+                metric_stats.std / abs(metric_stats.mean)
+                if metric_stats.mean != 0
                 else float("inf")
             )
             consistency = "High" if cv < 0.1 else "Medium" if cv < 0.3 else "Low"
-            display_name = (
-                "Predicted Probability"
-                if metric_name == "estimated_probability"
-                else metric_name.title()
-            )
-            report_lines.append(
-                f"{display_name} consistency: {consistency} (CV: {cv:.3f})"
+            yield (
+                f"{_market_display_name(metric_name)} consistency: "
+                f"{consistency} (CV: {cv:.3f})"
             )
 
     # Add event-level analysis
-    report_lines.extend(
-        [
-            "",
-            "EVENT-LEVEL ANALYSIS:",
-            "=" * 30,
-        ]
-    )
+    yield ""
+    yield "EVENT-LEVEL ANALYSIS:"
+    yield "=" * 30
 
     for metric_name, metric_stats in event_stats.items():
         if metric_name in [
@@ -1232,43 +1527,50 @@ def create_summary_report(
             "unallocated_capital",
             "num_markets_per_event",
         ]:
-            display_name = metric_name.replace("_", " ").title()
-            report_lines.extend(
-                [
-                    "",
-                    f"{display_name}:",
-                    f"  Mean: {metric_stats['mean']:.3f}",
-                    f"  Std Dev: {metric_stats['std']:.3f}",
-                    f"  Range: [{metric_stats['min']:.3f}, {metric_stats['max']:.3f}]",
-                    f"  Median: {metric_stats['median']:.3f}",
-                ]
+            yield from _metric_display_lines(
+                metric_name.replace("_", " ").title(), metric_stats
             )
 
     # Key insights
-    report_lines.extend(
-        [
-            "",
-            "KEY INSIGHTS:",
-            "=" * 20,
-        ]
-    )
+    yield ""
+    yield "KEY INSIGHTS:"
+    yield "=" * 20
 
     if "num_markets_per_event" in event_stats:
-        avg_markets = event_stats["num_markets_per_event"]["mean"]
-        report_lines.append(f"• Average markets per event: {avg_markets:.1f}")
+        avg_markets = event_stats["num_markets_per_event"].mean
+        yield f"• Average markets per event: {avg_markets:.1f}"
 
     if "total_allocated" in event_stats and "unallocated_capital" in event_stats:
-        avg_allocated = event_stats["total_allocated"]["mean"]
-        avg_unallocated = event_stats["unallocated_capital"]["mean"]
-        report_lines.extend(
-            [
-                f"• Average capital allocation: {avg_allocated:.1%}",
-                f"• Average unallocated capital: {avg_unallocated:.1%}",
-            ]
+        yield f"• Average capital allocation: {event_stats['total_allocated'].mean:.1%}"
+        yield (
+            "• Average unallocated capital: "
+            f"{event_stats['unallocated_capital'].mean:.1%}"
         )
 
-    with open(output_dir / "summary_report.txt", "w") as f:
-        f.write("\n".join(report_lines))
+
+def create_summary_report(
+    market_stats: Dict[str, Stats],
+    event_stats: Dict[str, Stats],
+    model_info: ModelInfo,
+    num_runs: int,
+    num_events: int,
+    num_market_decisions: int,
+    num_unique_markets: int,
+    output_dir: Path,
+):
+    """Create a human-readable summary report."""
+    report = "\n".join(
+        _iter_report_lines(
+            market_stats,
+            event_stats,
+            model_info,
+            num_runs,
+            num_events,
+            num_market_decisions,
+            num_unique_markets,
+        )
+    )
+    (output_dir / "summary_report.txt").write_text(report)
 
 
 def main():
@@ -1285,57 +1587,80 @@ def main():
 
     num_runs = 10
     num_events = 2
+    target_date = date.today()
 
     # Run experiments
     logger.info("Starting distribution analysis...")
-    results = run_multiple_experiments(model_info, num_runs, num_events)
+    stored_indices = _stored_run_indices(model_info.model_id, num_runs, target_date)
+    results = run_multiple_experiments(
+        model_info,
+        num_runs,
+        num_events,
+        target_date=target_date,
+        stored_indices=stored_indices,
+    )
 
     if not results:
         logger.error("No results obtained. Exiting.")
         return
 
-    # Extract metrics and calculate statistics
-    market_metrics, event_metrics, market_by_event_metrics, market_details = (
-        extract_decision_metrics(results)
-    )
-    market_stats = calculate_statistics(market_metrics)
-    event_stats = calculate_statistics(event_metrics)
-
     # Create output directory
     output_dir = Path("llm_distribution_analysis")
     output_dir.mkdir(exist_ok=True)
 
+    # Extract metrics and calculate statistics. Freshly generated runs are already
+    # in memory; only when every run came from storage is the cached extraction of
+    # the saved files worth using
+    if len(stored_indices) == len(results):
+        result_files = [
+            get_run_result_path(model_info.model_id, target_date, run_idx)
+            / "model_investment_decisions.json"
+            for run_idx in stored_indices
+        ]
+        market_metrics, event_metrics, market_by_event_metrics, market_details = (
+            load_or_extract_decision_metrics(result_files, output_dir / "cache")
+        )
+    else:
+        market_metrics, event_metrics, market_by_event_metrics, market_details = (
+            extract_decision_metrics(results)
+        )
+    market_stats = calculate_statistics(market_metrics.to_dict())
+    event_stats = calculate_statistics(event_metrics)
+
     # Create visualizations
     plt.style.use("default")
     sns.set_palette("husl")
 
-    logger.info("Creating market behavior overview...")
-    create_market_behavior_overview(
-        market_metrics, model_info.model_pretty_name, output_dir
-    )
+    try:
+        logger.info("Creating market behavior overview...")
+        create_market_behavior_overview(
+            market_metrics, model_info.model_pretty_name, output_dir
+        )
 
-    logger.info("Creating probability vs bet analysis...")
-    create_probability_bet_analysis(
-        market_metrics, model_info.model_pretty_name, output_dir
-    )
+        logger.info("Creating probability vs bet analysis...")
+        create_probability_bet_analysis(
+            market_metrics, model_info.model_pretty_name, output_dir
+        )
 
-    logger.info("Creating confidence vs bet analysis...")
-    create_confidence_vs_bet_analysis(
-        market_metrics, model_info.model_pretty_name, output_dir
-    )
+        logger.info("Creating confidence vs bet analysis...")
+        create_confidence_vs_bet_analysis(
+            market_metrics, model_info.model_pretty_name, output_dir
+        )
 
-    logger.info("Creating market consistency analysis...")
-    create_market_consistency_analysis(
-        market_details, model_info.model_pretty_name, output_dir
-    )
+        logger.info("Creating market consistency analysis...")
+        create_market_consistency_analysis(
+            market_details, model_info.model_pretty_name, output_dir
+        )
 
-    logger.info("Creating within-event structure analysis...")
-    create_within_event_structure_analysis(
-        market_by_event_metrics,
-        market_details,
-        model_info.model_pretty_name,
-        output_dir,
-    )
+        logger.info("Creating within-event structure analysis...")
+        create_within_event_structure_analysis(
+            market_by_event_metrics,
+            market_details,
+            model_info.model_pretty_name,
+            output_dir,
+        )
+    finally:
+        _close_reusable_figures()
 
     # Save all results
     logger.info("Saving results...")
@@ -1351,7 +1676,7 @@ def main():
 
     # Create summary report
     logger.info("Creating summary report...")
-    num_market_decisions = len(market_metrics.get("estimated_probability", []))
+    num_market_decisions = len(market_metrics.estimated_probability)
     num_unique_markets = len(market_details)
     create_summary_report(
         market_stats,
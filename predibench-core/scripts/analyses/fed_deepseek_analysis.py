@@ -3,9 +3,11 @@
 Fed Event Analysis with DeepSeek - Individual Model Analysis
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+import orjson
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -56,91 +58,89 @@ MARKET_PRICES = {
     },
 }
 
+# Price lookups by market question, built once for vectorized mapping
+DECISION_PRICES = pd.Series(
+    {market: prices["decision_time_price"] for market, prices in MARKET_PRICES.items()}
+)
+CURRENT_PRICES = pd.Series(
+    {market: prices["current_price"] for market, prices in MARKET_PRICES.items()}
+)
 
-def calculate_returns(bet_amount, decision_price, current_price):
-    """Calculate hypothetical returns based on price movement."""
-    if bet_amount == 0:
-        return 0
-
-    price_change = current_price - decision_price
 
-    if bet_amount > 0:  # Long position
-        return bet_amount * (price_change / decision_price)
-    else:  # Short position
-        return abs(bet_amount) * (-price_change / decision_price)
+def calculate_returns(bet_amount, decision_price, current_price):
+    """Calculate hypothetical returns based on price movement.
+
+    Works element-wise on scalars or arrays: a long bet gains when the price rises
+    and a short (negative) bet gains when it falls, so both reduce to
+    bet * change / price. Zero bets return 0.
+    """
+    bet_amount = np.asarray(bet_amount, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = bet_amount * (current_price - decision_price) / decision_price
+    return np.where(bet_amount == 0, 0.0, returns)
+
+
+def _load_run(run_path: Path, run_idx: int) -> dict | None:
+    """Load a single run file, returning None if it is missing or unreadable."""
+    if not run_path.exists():
+        return None
+    try:
+        data = orjson.loads(run_path.read_bytes())
+    except Exception as e:
+        logger.warning(f"Failed to load {run_path}: {e}")
+        return None
+    data["run_index"] = run_idx
+    return data
 
 
 def load_model_data(model_id: str, run_indices: list) -> list:
     """Load all runs for a specific model."""
     results_path = Path(RESULTS_BASE_PATH)
-    all_runs = []
-
-    for run_idx in run_indices:
-        run_path = (
-            results_path
-            / f"{model_id}_run_{run_idx}"
-            / "model_investment_decisions.json"
-        )
-        if run_path.exists():
-            try:
-                with open(run_path, "r") as f:
-                    data = json.load(f)
-                    data["run_index"] = run_idx
-                    all_runs.append(data)
-            except Exception as e:
-                logger.warning(f"Failed to load {run_path}: {e}")
+    run_paths = [
+        results_path / f"{model_id}_run_{run_idx}" / "model_investment_decisions.json"
+        for run_idx in run_indices
+    ]
 
-    return all_runs
+    # Overlap the file reads and parses; map keeps the runs in index order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        loaded_runs = executor.map(_load_run, run_paths, run_indices)
+        return [data for data in loaded_runs if data is not None]
 
 
 def extract_fed_data(all_runs: list, model_name: str) -> pd.DataFrame:
     """Extract Fed event data from all runs with returns calculation."""
-    fed_decisions = []
-
-    for run_data in all_runs:
-        run_idx = run_data["run_index"]
-
-        for event in run_data["event_investment_decisions"]:
-            if event["event_id"] == FED_EVENT_ID:
-                for market in event["market_investment_decisions"]:
-                    decision = market["decision"]
-                    market_question = market["market_question"]
-
-                    # Calculate returns if market price data available
-                    returns = 0
-                    if market_question in MARKET_PRICES:
-                        decision_price = MARKET_PRICES[market_question][
-                            "decision_time_price"
-                        ]
-                        current_price = MARKET_PRICES[market_question]["current_price"]
-                        returns = calculate_returns(
-                            decision["bet"], decision_price, current_price
-                        )
-
-                    # Determine bet direction outcome
-                    bet_direction = "None"
-                    if decision["bet"] > 0:
-                        bet_direction = "Long"
-                    elif decision["bet"] < 0:
-                        bet_direction = "Short"
-
-                    # Include all decisions for Fed event
-                    market_data = {
-                        "run_index": run_idx,
-                        "model": model_name,
-                        "market_id": market["market_id"],
-                        "market_question": market_question,
-                        "estimated_probability": decision["estimated_probability"],
-                        "bet": decision["bet"],
-                        "confidence": decision["confidence"],
-                        "rationale": decision["rationale"],
-                        "returns": returns,
-                        "bet_direction": bet_direction,
-                    }
-
-                    fed_decisions.append(market_data)
-
-    return pd.DataFrame(fed_decisions)
+    records = [
+        {
+            "run_index": run_data["run_index"],
+            "model": model_name,
+            "market_id": market["market_id"],
+            "market_question": market["market_question"],
+            "estimated_probability": market["decision"]["estimated_probability"],
+            "bet": market["decision"]["bet"],
+            "confidence": market["decision"]["confidence"],
+            "rationale": market["decision"]["rationale"],
+        }
+        for run_data in all_runs
+        for event in run_data["event_investment_decisions"]
+        if event["event_id"] == FED_EVENT_ID
+        for market in event["market_investment_decisions"]
+    ]
+    fed_df = pd.DataFrame.from_records(records)
+    if fed_df.empty:
+        return fed_df
+
+    # Markets without price data (and zero bets) have no returns
+    decision_price = fed_df["market_question"].map(DECISION_PRICES)
+    current_price = fed_df["market_question"].map(CURRENT_PRICES)
+    returns = calculate_returns(
+        fed_df["bet"].to_numpy(), decision_price.to_numpy(), current_price.to_numpy()
+    )
+    fed_df["returns"] = np.where(np.isnan(returns), 0.0, returns)
+
+    fed_df["bet_direction"] = np.where(
+        fed_df["bet"] > 0, "Long", np.where(fed_df["bet"] < 0, "Short", "None")
+    )
+    return fed_df
 
 
 def create_deepseek_individual_analysis():
@@ -196,13 +196,28 @@ def create_deepseek_individual_analysis():
     # Market colors
     colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728"]
 
+    traces = []
+    trace_rows = []
+    trace_cols = []
+
+    def add(trace, row, col):
+        traces.append(trace)
+        trace_rows.append(row)
+        trace_cols.append(col)
+
+    market_groups = dict(list(fed_df.groupby("market_question", sort=False)))
+    direction_groups = dict(
+        list(fed_df.groupby(["market_question", "bet_direction"], sort=False))
+    )
+
     # Process each market (each gets its own row)
     for market_idx, market in enumerate(markets):
-        market_subset = fed_df[fed_df["market_question"] == market]
+        market_subset = market_groups[market]
         color = colors[market_idx]
+        row = market_idx + 1
 
         # Column 1: Estimated Probability with individual points
-        fig.add_trace(
+        add(
             go.Box(
                 y=market_subset["estimated_probability"],
                 name=MARKET_PRICES[market]["short_name"],
@@ -214,28 +229,18 @@ def create_deepseek_individual_analysis():
                 width=0.6,
                 opacity=0.7,
             ),
-            row=market_idx + 1,
-            col=1,
+            row,
+            1,
         )
 
-        # Add decision time market price line only
-        if market in MARKET_PRICES:
-            # Decision time price (THICK red solid) - no annotation
-            fig.add_hline(
-                y=MARKET_PRICES[market]["decision_time_price"],
-                line=dict(color="red", width=4, dash="solid"),
-                row=market_idx + 1,
-                col=1,
-            )
-
         # Column 2: Bet Amount with color-coded points by direction
         # Create separate traces for Long/Short/None bets
-        long_bets = market_subset[market_subset["bet_direction"] == "Long"]
-        short_bets = market_subset[market_subset["bet_direction"] == "Short"]
-        no_bets = market_subset[market_subset["bet_direction"] == "None"]
+        long_bets = direction_groups.get((market, "Long"))
+        short_bets = direction_groups.get((market, "Short"))
+        no_bets = direction_groups.get((market, "None"))
 
         # Box plot for all bets
-        fig.add_trace(
+        add(
             go.Box(
                 y=market_subset["bet"],
                 name=MARKET_PRICES[market]["short_name"],
@@ -245,13 +250,13 @@ def create_deepseek_individual_analysis():
                 width=0.4,
                 opacity=0.5,
             ),
-            row=market_idx + 1,
-            col=2,
+            row,
+            2,
         )
 
         # Add colored scatter points for bet directions
-        if not long_bets.empty:
-            fig.add_trace(
+        if long_bets is not None:
+            add(
                 go.Scatter(
                     x=[0] * len(long_bets),
                     y=long_bets["bet"],
@@ -261,12 +266,12 @@ def create_deepseek_individual_analysis():
                     showlegend=(market_idx == 0),
                     hovertemplate="Long bet: %{y:.2f}<extra></extra>",
                 ),
-                row=market_idx + 1,
-                col=2,
+                row,
+                2,
             )
 
-        if not short_bets.empty:
-            fig.add_trace(
+        if short_bets is not None:
+            add(
                 go.Scatter(
                     x=[0] * len(short_bets),
                     y=short_bets["bet"],
@@ -276,12 +281,12 @@ def create_deepseek_individual_analysis():
                     showlegend=(market_idx == 0),
                     hovertemplate="Short bet: %{y:.2f}<extra></extra>",
                 ),
-                row=market_idx + 1,
-                col=2,
+                row,
+                2,
             )
 
-        if not no_bets.empty:
-            fig.add_trace(
+        if no_bets is not None:
+            add(
                 go.Scatter(
                     x=[0] * len(no_bets),
                     y=no_bets["bet"],
@@ -291,22 +296,12 @@ def create_deepseek_individual_analysis():
                     showlegend=(market_idx == 0),
                     hovertemplate="No bet: %{y:.2f}<extra></extra>",
                 ),
-                row=market_idx + 1,
-                col=2,
+                row,
+                2,
             )
 
-        # Add zero line for bet amounts
-        fig.add_hline(
-            y=0,
-            line=dict(color="black", width=2, dash="solid"),
-            annotation_text="No Bet",
-            annotation_position="top right",
-            row=market_idx + 1,
-            col=2,
-        )
-
         # Column 3: Confidence with individual points
-        fig.add_trace(
+        add(
             go.Box(
                 y=market_subset["confidence"],
                 name=MARKET_PRICES[market]["short_name"],
@@ -318,8 +313,33 @@ def create_deepseek_individual_analysis():
                 width=0.6,
                 opacity=0.7,
             ),
+            row,
+            3,
+        )
+
+    # Validate and attach all traces in one pass; reference lines go after, since
+    # add_hline skips subplots that have no traces yet
+    fig.add_traces(traces, rows=trace_rows, cols=trace_cols)
+
+    for market_idx, market in enumerate(markets):
+        # Add decision time market price line only
+        if market in MARKET_PRICES:
+            # Decision time price (THICK red solid) - no annotation
+            fig.add_hline(
+                y=MARKET_PRICES[market]["decision_time_price"],
+                line=dict(color="red", width=4, dash="solid"),
+                row=market_idx + 1,
+                col=1,
+            )
+
+        # Add zero line for bet amounts
+        fig.add_hline(
+            y=0,
+            line=dict(color="black", width=2, dash="solid"),
+            annotation_text="No Bet",
+            annotation_position="top right",
             row=market_idx + 1,
-            col=3,
+            col=2,
         )
 
     # Update layout
@@ -3,12 +3,19 @@
 Fed Event Readable Analysis - Clean, Non-overlapping Visualizations
 """
 
-import json
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
+import numpy as np
+import orjson
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
+import typer
 from plotly.subplots import make_subplots
 from predibench.common import (
     DATA_PATH,
@@ -16,10 +23,37 @@ from predibench.common import (
     PREFIX_MODEL_RESULTS,
 )
 from predibench.logger_config import get_logger
-from predibench.utils import apply_template
+from predibench.utils import BOLD_FONT_FAMILY, FONT_FAMILY
 
 logger = get_logger(__name__)
 
+app = typer.Typer(help="Readable Fed event analysis")
+
+# Same styling as predibench.utils.apply_template (font size 14), registered once
+# so each figure only references it by name
+FED_TEMPLATE = go.layout.Template(pio.templates["none"])
+FED_TEMPLATE.layout.update(
+    font=dict(family=FONT_FAMILY, size=14),
+    legend=dict(
+        itemsizing="constant",
+        title_font_family=BOLD_FONT_FAMILY,
+        font=dict(family=BOLD_FONT_FAMILY, size=14),
+        itemwidth=30,
+    ),
+    margin=dict(r=20, t=20),
+    xaxis=dict(
+        title_font_family=FONT_FAMILY,
+        tickfont=dict(family=FONT_FAMILY, size=14),
+        linewidth=1,
+    ),
+    yaxis=dict(
+        title_font_family=FONT_FAMILY,
+        tickfont=dict(family=FONT_FAMILY, size=14),
+        linewidth=1,
+    ),
+)
+pio.templates["fed"] = FED_TEMPLATE
+
 
 def _get_latest_results_base_path() -> Path:
     """Return the latest date folder under bucket-prod/model_results."""
@@ -91,288 +125,406 @@ MARKET_PRICES = {
 }
 
 
+# Per-market lookups as arrays aligned with the sorted market questions, so loops
+# and the returns computation index by position instead of nested dict lookups
+SORTED_MARKETS = sorted(MARKET_PRICES)
+MARKET_INDEX = pd.Index(SORTED_MARKETS)
+SHORT_NAMES = np.array([MARKET_PRICES[m]["short_name"] for m in SORTED_MARKETS])
+DECISION_PRICES = np.array(
+    [MARKET_PRICES[m]["decision_time_price"] for m in SORTED_MARKETS]
+)
+CURRENT_PRICES = np.array([MARKET_PRICES[m]["current_price"] for m in SORTED_MARKETS])
+
+
+# Subplot layouts shared by every figure build. make_subplots fills in missing
+# defaults on these dicts in place, which leaves later builds unchanged
+SPECS_4X2 = [[{"type": "xy"}] * 2 for _ in range(4)]
+SPECS_2X4 = [[{"type": "xy"}] * 4 for _ in range(2)]
+SPECS_1X2 = [[{"type": "xy"}] * 2]
+# Only the first row of the per-model grid gets column titles
+INDIVIDUAL_SUBPLOT_TITLES = ["Estimated Probability", "Bet Amount"] + [""] * 6
+
+
 # For returns calculation, we'll use current price movement as proxy
 # Positive bet = buying "Yes", Negative bet = buying "No"
 def calculate_returns(bet_amount, decision_price, current_price):
-    """Calculate hypothetical returns based on price movement."""
-    if bet_amount == 0:
-        return 0
-
-    # Price movement from decision time to current
-    price_change = current_price - decision_price
-
-    # If betting "Yes" (positive bet) and price increased, profit
-    # If betting "No" (negative bet) and price decreased, profit
-    if bet_amount > 0:  # Long position
-        return bet_amount * (price_change / decision_price)
-    else:  # Short position
-        return abs(bet_amount) * (-price_change / decision_price)
+    """Calculate hypothetical returns based on price movement.
+
+    Works element-wise on scalars or arrays: a long bet gains when the price rises
+    and a short (negative) bet gains when it falls, so both reduce to
+    bet * change / price. Zero bets return 0.
+    """
+    bet_amount = np.asarray(bet_amount, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = bet_amount * (current_price - decision_price) / decision_price
+    return np.where(bet_amount == 0, 0.0, returns)
+
+
+def _market_positions(markets) -> np.ndarray:
+    """Return each market's position in the price arrays, -1 when it has no prices."""
+    return MARKET_INDEX.get_indexer(markets)
+
+
+def _short_names(markets: list[str], positions: np.ndarray) -> list[str]:
+    """Short display names, falling back to the full question for unknown markets."""
+    return np.where(positions >= 0, SHORT_NAMES[positions], markets).tolist()
+
+
+def _plot_values(values) -> np.ndarray:
+    """Single precision copy of trace data; Plotly sends it as a half-size f4 array."""
+    return np.asarray(values, dtype=np.float32)
+
+
+def _box_summary(values) -> dict:
+    """Precompute the quartiles and whiskers Plotly would derive from raw values.
+
+    Quartiles use Plotly's default "linear" quartile method (Hazen positions) and
+    whiskers end at the most extreme values within 1.5 IQR of the box. With no
+    values there is nothing to summarize, so the (empty) raw data is passed on.
+    """
+    sorted_values = np.sort(np.asarray(values, dtype=np.float64))
+    if sorted_values.size == 0:
+        return {"y": sorted_values}
+    q1, median, q3 = np.quantile(sorted_values, [0.25, 0.5, 0.75], method="hazen")
+    iqr = q3 - q1
+    inside = sorted_values[
+        (sorted_values >= q1 - 1.5 * iqr) & (sorted_values <= q3 + 1.5 * iqr)
+    ]
+    return {
+        "q1": [q1],
+        "median": [median],
+        "q3": [q3],
+        "lowerfence": [min(inside[0], q1)],
+        "upperfence": [max(inside[-1], q3)],
+    }
+
+
+def _load_run(run_path: Path, run_idx: int) -> dict | None:
+    """Load a single run file, returning None if it is missing or unreadable."""
+    if not run_path.exists():
+        return None
+    try:
+        data = orjson.loads(run_path.read_bytes())
+    except Exception as e:
+        logger.warning(f"Failed to load {run_path}: {e}")
+        return None
+    # Only the Fed event is analyzed; drop the rest so each run keeps a small tree
+    data["event_investment_decisions"] = [
+        event
+        for event in data["event_investment_decisions"]
+        if event["event_id"] == FED_EVENT_ID
+    ]
+    data["run_index"] = run_idx
+    return data
 
 
 def load_model_data(model_id: str, run_indices: list) -> list:
     """Load all runs for a specific model."""
     results_path = RESULTS_BASE_PATH
-    all_runs = []
-
-    for run_idx in run_indices:
-        run_path = (
-            results_path
-            / f"{model_id}_run_{run_idx}"
-            / "model_investment_decisions.json"
-        )
-        if run_path.exists():
-            try:
-                with open(run_path, "r") as f:
-                    data = json.load(f)
-                    data["run_index"] = run_idx
-                    all_runs.append(data)
-            except Exception as e:
-                logger.warning(f"Failed to load {run_path}: {e}")
-
-    return all_runs
+    run_paths = [
+        results_path / f"{model_id}_run_{run_idx}" / "model_investment_decisions.json"
+        for run_idx in run_indices
+    ]
+
+    # Overlap the file reads and parses; map keeps the runs in index order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        loaded_runs = executor.map(_load_run, run_paths, run_indices)
+        return [data for data in loaded_runs if data is not None]
+
+
+def _fed_records(all_runs: list, model_name: str) -> list[dict]:
+    """Flatten the Fed event decisions of all runs into one record per market."""
+    return [
+        {
+            "run_index": run_data["run_index"],
+            "model": model_name,
+            "market_id": market["market_id"],
+            "market_question": market["market_question"],
+            "estimated_probability": market["decision"]["estimated_probability"],
+            "bet": market["decision"]["bet"],
+            "confidence": market["decision"]["confidence"],
+            "rationale": market["decision"]["rationale"],
+        }
+        for run_data in all_runs
+        for event in run_data["event_investment_decisions"]
+        if event["event_id"] == FED_EVENT_ID
+        for market in event["market_investment_decisions"]
+    ]
+
+
+def _add_returns(fed_df: pd.DataFrame) -> pd.DataFrame:
+    """Add the returns and bet direction columns to Fed decision records."""
+    # Markets without price data (and zero bets) have no returns
+    positions = _market_positions(fed_df["market_question"])
+    known = positions >= 0
+    decision_price = np.where(known, DECISION_PRICES[positions], np.nan)
+    current_price = np.where(known, CURRENT_PRICES[positions], np.nan)
+    returns = calculate_returns(fed_df["bet"].to_numpy(), decision_price, current_price)
+    fed_df["returns"] = np.where(np.isnan(returns), 0.0, returns)
+
+    fed_df["bet_direction"] = np.select(
+        [fed_df["bet"] > 0, fed_df["bet"] < 0], ["Long", "Short"], default="None"
+    )
+    return fed_df
 
 
 def extract_fed_data(all_runs: list, model_name: str) -> pd.DataFrame:
     """Extract Fed event data from all runs with returns calculation."""
-    fed_decisions = []
-
-    for run_data in all_runs:
-        run_idx = run_data["run_index"]
-
-        for event in run_data["event_investment_decisions"]:
-            if event["event_id"] == FED_EVENT_ID:
-                for market in event["market_investment_decisions"]:
-                    decision = market["decision"]
-                    market_question = market["market_question"]
-
-                    # Calculate returns if market price data available
-                    returns = 0
-                    if market_question in MARKET_PRICES:
-                        decision_price = MARKET_PRICES[market_question][
-                            "decision_time_price"
-                        ]
-                        current_price = MARKET_PRICES[market_question]["current_price"]
-                        returns = calculate_returns(
-                            decision["bet"], decision_price, current_price
-                        )
-
-                    # Determine bet direction outcome
-                    bet_direction = "None"
-                    if decision["bet"] > 0:
-                        bet_direction = "Long"
-                    elif decision["bet"] < 0:
-                        bet_direction = "Short"
-
-                    # Include all decisions for Fed event
-                    market_data = {
-                        "run_index": run_idx,
-                        "model": model_name,
-                        "market_id": market["market_id"],
-                        "market_question": market_question,
-                        "estimated_probability": decision["estimated_probability"],
-                        "bet": decision["bet"],
-                        "confidence": decision["confidence"],
-                        "rationale": decision["rationale"],
-                        "returns": returns,
-                        "bet_direction": bet_direction,
-                    }
-
-                    fed_decisions.append(market_data)
-
-    return pd.DataFrame(fed_decisions)
-
-
-def create_readable_individual_analysis():
-    """Create readable individual model analysis with proper spacing."""
-    repo_root = Path(__file__).resolve().parents[3]
-    html_out_dir = repo_root / "analyses/fed_event_analysis_readable"
-    html_out_dir.mkdir(parents=True, exist_ok=True)
+    fed_df = pd.DataFrame.from_records(_fed_records(all_runs, model_name))
+    if fed_df.empty:
+        return fed_df
+    return _add_returns(fed_df)
 
-    json_out_dir = FRONTEND_PUBLIC_PATH / "fed_event_analysis_readable"
-    json_out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load data for both models
-    all_fed_data = []
+@lru_cache(maxsize=1)
+def _load_combined_fed_data() -> tuple[pd.DataFrame, list[str]]:
+    """Load Fed data for all models once, with the sorted market questions.
 
+    The result is shared by every analysis, so callers must not modify it.
+    """
+    # Collect every model's records first so the frame is built in one pass
+    records = []
     for model_id, config in MODELS_CONFIG.items():
         all_runs = load_model_data(model_id, config["runs"])
-        if all_runs:
-            fed_df = extract_fed_data(all_runs, config["name"])
-            if not fed_df.empty:
-                all_fed_data.append(fed_df)
+        records.extend(_fed_records(all_runs, config["name"]))
+
+    if not records:
+        return pd.DataFrame(), []
+
+    combined_fed_df = _add_returns(pd.DataFrame.from_records(records))
+    # Few distinct labels repeat on every row; compare them as category codes
+    for column in ("model", "market_id", "market_question", "bet_direction"):
+        combined_fed_df[column] = combined_fed_df[column].astype("category")
+    return combined_fed_df, sorted(combined_fed_df["market_question"].unique())
+
+
+@lru_cache(maxsize=1)
+def _model_market_groups() -> dict[tuple[str, str], pd.DataFrame]:
+    """Split the combined Fed data once into (model, market) groups.
+
+    Groups keep the order in which models and markets first appear, matching the
+    order of ``unique()`` on the respective columns.
+    """
+    combined_fed_df, _ = _load_combined_fed_data()
+    return dict(
+        list(
+            combined_fed_df.groupby(
+                ["model", "market_question"], observed=True, sort=False
+            )
+        )
+    )
 
-    if not all_fed_data:
-        logger.error("No Fed event data found")
-        return
 
-    # Combine all Fed data
-    combined_fed_df = pd.concat(all_fed_data, ignore_index=True)
-    markets = sorted(combined_fed_df["market_question"].unique())
-
-    # Create separate plots for each model with GRID LAYOUT
-    for model_name in combined_fed_df["model"].unique():
-        model_data = combined_fed_df[combined_fed_df["model"] == model_name]
-
-        # Create 4x2 grid: 4 markets (rows) x 2 metrics (columns)
-        fig = make_subplots(
-            rows=4,
-            cols=2,
-            subplot_titles=[
-                "Estimated Probability",
-                "Bet Amount",
-                "",
-                "",  # Empty titles for remaining rows
-                "",
-                "",
-                "",
-                "",
-            ],
-            vertical_spacing=0.15,
-            horizontal_spacing=0.20,
-            row_titles=[MARKET_PRICES[market]["short_name"] for market in markets],
-            specs=[[{"type": "xy"} for _ in range(2)] for _ in range(4)],
-        )
+def _build_model_figure(
+    market_subsets: list[pd.DataFrame], positions: np.ndarray, short_names: list[str]
+) -> go.Figure:
+    """Build one model's 4x2 grid figure from its per-market decision subsets.
 
-        # Market colors
-        colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728"]
+    Runs in a worker process, so it only depends on its arguments and module
+    constants.
+    """
+    # Create 4x2 grid: 4 markets (rows) x 2 metrics (columns)
+    fig = make_subplots(
+        rows=4,
+        cols=2,
+        subplot_titles=INDIVIDUAL_SUBPLOT_TITLES,
+        vertical_spacing=0.15,
+        horizontal_spacing=0.20,
+        row_titles=short_names,
+        specs=SPECS_4X2,
+    )
 
-        # Process each market (each gets its own row)
-        for market_idx, market in enumerate(markets):
-            market_subset = model_data[model_data["market_question"] == market]
-            color = colors[market_idx]
+    # Market colors
+    colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728"]
 
-            # Column 1: Estimated Probability with individual points
-            fig.add_trace(
-                go.Box(
-                    y=market_subset["estimated_probability"],
-                    name=MARKET_PRICES[market]["short_name"],
-                    marker_color=color,
-                    showlegend=False,
-                    boxpoints="all",  # Show all individual points
-                    jitter=0.3,
-                    pointpos=0,
-                    width=0.6,
-                    opacity=0.7,
-                ),
+    # Process each market (each gets its own row)
+    for market_idx, market_subset in enumerate(market_subsets):
+        color = colors[market_idx]
+
+        # Column 1: Estimated Probability with individual points
+        fig.add_trace(
+            go.Box(
+                y=_plot_values(market_subset["estimated_probability"]),
+                name=short_names[market_idx],
+                marker_color=color,
+                showlegend=False,
+                boxpoints="all",  # Show all individual points
+                jitter=0.3,
+                pointpos=0,
+                width=0.6,
+                opacity=0.7,
+            ),
+            row=market_idx + 1,
+            col=1,
+        )
+
+        # Add decision time market price line only
+        if positions[market_idx] >= 0:
+            # Decision time price (THICK red solid) - no annotation
+            fig.add_hline(
+                y=DECISION_PRICES[positions[market_idx]],
+                line=dict(color="red", width=4, dash="solid"),
                 row=market_idx + 1,
                 col=1,
             )
 
-            # Add decision time market price line only
-            if market in MARKET_PRICES:
-                # Decision time price (THICK red solid) - no annotation
-                fig.add_hline(
-                    y=MARKET_PRICES[market]["decision_time_price"],
-                    line=dict(color="red", width=4, dash="solid"),
-                    row=market_idx + 1,
-                    col=1,
-                )
+        # Column 2: Bet Amount with color-coded points by direction
+        # Create separate traces for Long/Short/None bets
+        long_bets = market_subset[market_subset["bet_direction"] == "Long"]
+        short_bets = market_subset[market_subset["bet_direction"] == "Short"]
+        no_bets = market_subset[market_subset["bet_direction"] == "None"]
 
-            # Column 2: Bet Amount with color-coded points by direction
-            # Create separate traces for Long/Short/None bets
-            long_bets = market_subset[market_subset["bet_direction"] == "Long"]
-            short_bets = market_subset[market_subset["bet_direction"] == "Short"]
-            no_bets = market_subset[market_subset["bet_direction"] == "None"]
+        # Box plot for all bets; points are hidden, so only the summary is sent
+        short_name = short_names[market_idx]
+        fig.add_trace(
+            go.Box(
+                x=[short_name],
+                **_box_summary(market_subset["bet"]),
+                name=short_name,
+                marker_color=color,
+                showlegend=False,
+                boxpoints=False,
+                width=0.4,
+                opacity=0.5,
+            ),
+            row=market_idx + 1,
+            col=2,
+        )
 
-            # Box plot for all bets
+        # Add colored scatter points for bet directions
+        if not long_bets.empty:
             fig.add_trace(
-                go.Box(
-                    y=market_subset["bet"],
-                    name=MARKET_PRICES[market]["short_name"],
-                    marker_color=color,
-                    showlegend=False,
-                    boxpoints=False,
-                    width=0.4,
-                    opacity=0.5,
+                go.Scattergl(
+                    x=np.zeros(len(long_bets), dtype=np.float32),
+                    y=_plot_values(long_bets["bet"]),
+                    mode="markers",
+                    marker=dict(color="green", size=6, symbol="triangle-up"),
+                    name="Long" if market_idx == 0 else None,
+                    showlegend=(market_idx == 0),
+                    hovertemplate="Long bet: %{y:.2f}<extra></extra>",
                 ),
                 row=market_idx + 1,
                 col=2,
             )
 
-            # Add colored scatter points for bet directions
-            if not long_bets.empty:
-                fig.add_trace(
-                    go.Scatter(
-                        x=[0] * len(long_bets),
-                        y=long_bets["bet"],
-                        mode="markers",
-                        marker=dict(color="green", size=6, symbol="triangle-up"),
-                        name="Long" if market_idx == 0 else None,
-                        showlegend=(market_idx == 0),
-                        hovertemplate="Long bet: %{y:.2f}<extra></extra>",
-                    ),
-                    row=market_idx + 1,
-                    col=2,
-                )
-
-            if not short_bets.empty:
-                fig.add_trace(
-                    go.Scatter(
-                        x=[0] * len(short_bets),
-                        y=short_bets["bet"],
-                        mode="markers",
-                        marker=dict(color="red", size=6, symbol="triangle-down"),
-                        name="Short" if market_idx == 0 else None,
-                        showlegend=(market_idx == 0),
-                        hovertemplate="Short bet: %{y:.2f}<extra></extra>",
-                    ),
-                    row=market_idx + 1,
-                    col=2,
-                )
-
-            if not no_bets.empty:
-                fig.add_trace(
-                    go.Scatter(
-                        x=[0] * len(no_bets),
-                        y=no_bets["bet"],
-                        mode="markers",
-                        marker=dict(color="gray", size=6, symbol="circle"),
-                        name="No Bet" if market_idx == 0 else None,
-                        showlegend=(market_idx == 0),
-                        hovertemplate="No bet: %{y:.2f}<extra></extra>",
-                    ),
-                    row=market_idx + 1,
-                    col=2,
-                )
+        if not short_bets.empty:
+            fig.add_trace(
+                go.Scattergl(
+                    x=np.zeros(len(short_bets), dtype=np.float32),
+                    y=_plot_values(short_bets["bet"]),
+                    mode="markers",
+                    marker=dict(color="red", size=6, symbol="triangle-down"),
+                    name="Short" if market_idx == 0 else None,
+                    showlegend=(market_idx == 0),
+                    hovertemplate="Short bet: %{y:.2f}<extra></extra>",
+                ),
+                row=market_idx + 1,
+                col=2,
+            )
 
-            # Add zero line for bet amounts
-            fig.add_hline(
-                y=0,
-                line=dict(color="black", width=2, dash="solid"),
-                annotation_text="No Bet",
-                annotation_position="top right",
+        if not no_bets.empty:
+            fig.add_trace(
+                go.Scattergl(
+                    x=np.zeros(len(no_bets), dtype=np.float32),
+                    y=_plot_values(no_bets["bet"]),
+                    mode="markers",
+                    marker=dict(color="gray", size=6, symbol="circle"),
+                    name="No Bet" if market_idx == 0 else None,
+                    showlegend=(market_idx == 0),
+                    hovertemplate="No bet: %{y:.2f}<extra></extra>",
+                ),
                 row=market_idx + 1,
                 col=2,
             )
 
-        # Update layout
-        fig.update_layout(height=1200, width=1800, showlegend=False, font=dict(size=12))
+        # Add zero line for bet amounts
+        fig.add_hline(
+            y=0,
+            line=dict(color="black", width=2, dash="solid"),
+            annotation_text="No Bet",
+            annotation_position="top right",
+            row=market_idx + 1,
+            col=2,
+        )
+
+    # Update layout
+    fig.update_layout(template="fed", height=1400, width=2000, showlegend=False)
+
+    # Set axis ranges and remove tick labels for cleaner look
+    for market_idx in range(4):
+        # Probability column: 0-1 range
+        fig.update_yaxes(range=[0, 1.05], row=market_idx + 1, col=1)
+        fig.update_xaxes(showticklabels=False, row=market_idx + 1, col=1)
+
+        # Bet amount column: auto range
+        fig.update_xaxes(showticklabels=False, row=market_idx + 1, col=2)
+
+    return fig
+
+
+def create_readable_individual_analysis(
+    submit_write: Callable[..., None], write_html: bool = False
+):
+    """Create readable individual model analysis with proper spacing."""
+    repo_root = Path(__file__).resolve().parents[3]
+    html_out_dir = repo_root / "analyses/fed_event_analysis_readable"
+    html_out_dir.mkdir(parents=True, exist_ok=True)
 
-        # Set axis ranges and remove tick labels for cleaner look
-        for market_idx in range(4):
-            # Probability column: 0-1 range
-            fig.update_yaxes(range=[0, 1.05], row=market_idx + 1, col=1)
-            fig.update_xaxes(showticklabels=False, row=market_idx + 1, col=1)
+    json_out_dir = FRONTEND_PUBLIC_PATH / "fed_event_analysis_readable"
+    json_out_dir.mkdir(parents=True, exist_ok=True)
 
-            # Bet amount column: auto range
-            fig.update_xaxes(showticklabels=False, row=market_idx + 1, col=2)
+    # Load data for both models
+    combined_fed_df, markets = _load_combined_fed_data()
+    if combined_fed_df.empty:
+        logger.error("No Fed event data found")
+        return
+    market_groups = _model_market_groups()
+    positions = _market_positions(markets)
+    short_names = _short_names(markets, positions)
+
+    # Create separate plots for each model with GRID LAYOUT; the figures are
+    # independent, so they are built in parallel worker processes
+    model_names = []
+    model_subsets = []
+    for model_name, model_data in combined_fed_df.groupby(
+        "model", observed=True, sort=False
+    ):
+        model_names.append(model_name)
+        model_subsets.append(
+            [
+                market_groups.get((model_name, market), model_data.iloc[:0])
+                for market in markets
+            ]
+        )
 
-        # Apply template
-        apply_template(fig, width=1800, height=1200)
-        fig.update_layout(width=2000, height=1400)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        figures = list(
+            executor.map(
+                _build_model_figure,
+                model_subsets,
+                repeat(positions),
+                repeat(short_names),
+            )
+        )
 
+    for model_name, fig in zip(model_names, figures):
         safe_model_name = model_name.replace(" ", "_").replace("/", "-")
-        html_path = (html_out_dir / f"fed_readable_{safe_model_name}.html").resolve()
-        fig.write_html(str(html_path))
+        if write_html:
+            html_path = (
+                html_out_dir / f"fed_readable_{safe_model_name}.html"
+            ).resolve()
+            submit_write(fig.write_html, str(html_path))
 
         # Save JSON to frontend public path
         json_path = (json_out_dir / f"fed_readable_{safe_model_name}.json").resolve()
-        fig.write_json(str(json_path))
+        submit_write(fig.write_json, str(json_path), engine="orjson")
 
         logger.info(f"Readable Fed analysis saved for {model_name}")
 
 
-def create_readable_comparative_analysis():
+def create_readable_comparative_analysis(
+    submit_write: Callable[..., None], write_html: bool = False
+):
     """Create readable comparative analysis with short market names."""
     repo_root = Path(__file__).resolve().parents[3]
     html_out_dir = repo_root / "analyses/fed_event_analysis_readable"
@@ -382,25 +534,14 @@ def create_readable_comparative_analysis():
     json_out_dir.mkdir(parents=True, exist_ok=True)
 
     # Load data for both models
-    all_fed_data = []
-
-    for model_id, config in MODELS_CONFIG.items():
-        all_runs = load_model_data(model_id, config["runs"])
-        if all_runs:
-            fed_df = extract_fed_data(all_runs, config["name"])
-            if not fed_df.empty:
-                all_fed_data.append(fed_df)
-
-    if len(all_fed_data) < 2:
+    combined_fed_df, markets = _load_combined_fed_data()
+    if combined_fed_df.empty or combined_fed_df["model"].nunique() < 2:
         logger.error("Need both models for comparative analysis")
         return
 
-    # Combine all Fed data
-    combined_fed_df = pd.concat(all_fed_data, ignore_index=True)
-    markets = sorted(combined_fed_df["market_question"].unique())
-
     # Create comparative subplot with SHORT NAMES
-    short_names = [MARKET_PRICES[market]["short_name"] for market in markets]
+    positions = _market_positions(markets)
+    short_names = _short_names(markets, positions)
 
     fig = make_subplots(
         rows=2,
@@ -408,7 +549,7 @@ def create_readable_comparative_analysis():
         subplot_titles=short_names,  # Only first row gets titles
         vertical_spacing=0.20,
         horizontal_spacing=0.10,
-        specs=[[{"type": "xy"} for _ in range(4)] for _ in range(2)],
+        specs=SPECS_2X4,
     )
 
     # Add y-axis titles on the left side
@@ -418,17 +559,17 @@ def create_readable_comparative_analysis():
     model_colors = {"QWEN 480B": "#1f77b4", "GPT OSS 120B": "#ff7f0e"}
 
     # For each market (column) and metric (row)
+    market_groups = _model_market_groups()
     for col_idx, market in enumerate(markets):
-        market_data = combined_fed_df[combined_fed_df["market_question"] == market]
-
-        for model_name in market_data["model"].unique():
-            model_subset = market_data[market_data["model"] == model_name]
+        for (model_name, group_market), model_subset in market_groups.items():
+            if group_market != market:
+                continue
             color = model_colors.get(model_name, "gray")
 
             # Row 1: Estimated Probability
             fig.add_trace(
                 go.Box(
-                    y=model_subset["estimated_probability"],
+                    y=_plot_values(model_subset["estimated_probability"]),
                     name=model_name,
                     marker_color=color,
                     showlegend=(col_idx == 0),  # Only show legend in first column
@@ -445,7 +586,7 @@ def create_readable_comparative_analysis():
             # Row 2: Bet Amount
             fig.add_trace(
                 go.Box(
-                    y=model_subset["bet"],
+                    y=_plot_values(model_subset["bet"]),
                     name=model_name,
                     marker_color=color,
                     showlegend=False,
@@ -460,14 +601,14 @@ def create_readable_comparative_analysis():
             )
 
         # Add market price lines to probability plots (row 1)
-        if market in MARKET_PRICES:
+        if positions[col_idx] >= 0:
             # Decision time price only (red solid)
             fig.add_hline(
-                y=MARKET_PRICES[market]["decision_time_price"],
+                y=DECISION_PRICES[positions[col_idx]],
                 line=dict(color="gray", width=2, dash="solid"),
                 row=1,
                 col=col_idx + 1,
-                text=MARKET_PRICES[market]["short_name"],
+                text=short_names[col_idx],
             )
 
         # Add zero line for bet amounts (row 2)
@@ -477,6 +618,7 @@ def create_readable_comparative_analysis():
 
     # Update layout
     fig.update_layout(
+        template="fed",
         height=600,
         width=800,
         showlegend=False,
@@ -504,21 +646,23 @@ def create_readable_comparative_analysis():
         for col in range(1, 5):
             fig.update_xaxes(showticklabels=False, row=row, col=col)
 
-    # Apply template
-    apply_template(fig, width=800, height=600)
-
-    html_path = (html_out_dir / "fed_readable_comparative.html").resolve()
-    fig.write_html(str(html_path))
+    if write_html:
+        html_path = (html_out_dir / "fed_readable_comparative.html").resolve()
+        submit_write(fig.write_html, str(html_path))
+        logger.info(
+            "Readable comparative Fed analysis saved in html under %s", html_path
+        )
 
     # Save JSON to frontend public path
     json_path = (json_out_dir / "fed_readable_comparative.json").resolve()
-    fig.write_json(str(json_path))
+    submit_write(fig.write_json, str(json_path), engine="orjson")
 
-    logger.info("Readable comparative Fed analysis saved  in json under %s", html_path)
-    logger.info("Readable comparative Fed analysis saved in html under %s", json_path)
+    logger.info("Readable comparative Fed analysis saved in json under %s", json_path)
 
 
-def create_returns_analysis():
+def create_returns_analysis(
+    submit_write: Callable[..., None], write_html: bool = False
+):
     """Create returns analysis showing actual P&L from bets."""
     repo_root = Path(__file__).resolve().parents[3]
     html_out_dir = repo_root / "analyses/fed_event_analysis_readable"
@@ -528,41 +672,31 @@ def create_returns_analysis():
     json_out_dir.mkdir(parents=True, exist_ok=True)
 
     # Load data for both models
-    all_fed_data = []
-
-    for model_id, config in MODELS_CONFIG.items():
-        all_runs = load_model_data(model_id, config["runs"])
-        if all_runs:
-            fed_df = extract_fed_data(all_runs, config["name"])
-            if not fed_df.empty:
-                all_fed_data.append(fed_df)
-
-    if not all_fed_data:
+    combined_fed_df, markets = _load_combined_fed_data()
+    if combined_fed_df.empty:
         logger.error("No Fed event data found for returns analysis")
         return
-
-    # Combine all Fed data
-    combined_fed_df = pd.concat(all_fed_data, ignore_index=True)
-    markets = sorted(combined_fed_df["market_question"].unique())
+    short_names = _short_names(markets, _market_positions(markets))
 
     # Create returns analysis figure
     fig = make_subplots(
         rows=1,
         cols=2,
         subplot_titles=["Returns Distribution by Model", "Returns by Market and Model"],
-        specs=[[{"type": "xy"}, {"type": "xy"}]],
+        specs=SPECS_1X2,
     )
 
     model_colors = {"QWEN 480B": "#1f77b4", "GPT OSS 120B": "#ff7f0e"}
 
+    model_groups = combined_fed_df.groupby("model", observed=True, sort=False)
+
     # 1. Returns distribution by model
-    for model_name in combined_fed_df["model"].unique():
-        model_data = combined_fed_df[combined_fed_df["model"] == model_name]
+    for model_name, model_data in model_groups:
         color = model_colors.get(model_name, "gray")
 
         fig.add_trace(
             go.Box(
-                y=model_data["returns"],
+                y=_plot_values(model_data["returns"]),
                 name=model_name,
                 marker_color=color,
                 showlegend=True,
@@ -579,26 +713,25 @@ def create_returns_analysis():
     fig.add_hline(y=0, line=dict(color="black", width=1, dash="dash"), row=1, col=1)
 
     # 2. Returns by market and model
-    for model_idx, model_name in enumerate(combined_fed_df["model"].unique()):
-        model_data = combined_fed_df[combined_fed_df["model"] == model_name]
-
+    market_groups = _model_market_groups()
+    for model_idx, (model_name, _) in enumerate(model_groups):
         for market_idx, market in enumerate(markets):
-            market_data = model_data[model_data["market_question"] == market]
-            short_name = MARKET_PRICES[market]["short_name"]
+            market_data = market_groups.get((model_name, market))
+            short_name = short_names[market_idx]
 
-            if not market_data.empty:
+            if market_data is not None:
                 x_pos = market_idx + (model_idx * 0.4 - 0.2)  # Offset for side-by-side
 
                 fig.add_trace(
                     go.Box(
-                        y=market_data["returns"],
+                        y=_plot_values(market_data["returns"]),
                         name=f"{model_name} - {short_name}",
                         marker_color=model_colors[model_name],
                         showlegend=False,
                         boxpoints="outliers",
                         width=0.3,
                         opacity=0.7,
-                        x=[x_pos] * len(market_data),
+                        x=np.full(len(market_data), x_pos, dtype=np.float32),
                     ),
                     row=1,
                     col=2,
@@ -608,7 +741,7 @@ def create_returns_analysis():
     fig.update_xaxes(
         tickmode="array",
         tickvals=list(range(len(markets))),
-        ticktext=[MARKET_PRICES[market]["short_name"] for market in markets],
+        ticktext=short_names,
         row=1,
         col=2,
     )
@@ -616,6 +749,7 @@ def create_returns_analysis():
 
     # Update layout
     fig.update_layout(
+        template="fed",
         height=600,
         width=800,
         showlegend=True,
@@ -638,23 +772,19 @@ def create_returns_analysis():
     fig.update_xaxes(title_text="Model", row=1, col=1)
     fig.update_xaxes(title_text="Market", row=1, col=2)
 
-    # Apply template
-    apply_template(fig, width=800, height=600)
-
-    html_path = (html_out_dir / "fed_returns_analysis.html").resolve()
-    fig.write_html(str(html_path))
+    if write_html:
+        html_path = (html_out_dir / "fed_returns_analysis.html").resolve()
+        submit_write(fig.write_html, str(html_path))
 
     # Save JSON to frontend public path
     json_path = (json_out_dir / "fed_returns_analysis.json").resolve()
-    fig.write_json(str(json_path))
+    submit_write(fig.write_json, str(json_path), engine="orjson")
 
     logger.info("Fed returns analysis saved")
 
     # Generate returns summary statistics
     returns_summary = {}
-    for model_name in combined_fed_df["model"].unique():
-        model_data = combined_fed_df[combined_fed_df["model"] == model_name]
-
+    for model_name, model_data in model_groups:
         returns_summary[model_name] = {
             "total_return": float(model_data["returns"].sum()),
             "mean_return": float(model_data["returns"].mean()),
@@ -668,20 +798,38 @@ def create_returns_analysis():
         }
 
     summary_path = (html_out_dir / "fed_returns_summary.json").resolve()
-    with open(summary_path, "w") as f:
-        json.dump(returns_summary, f, indent=2)
+    summary_path.write_bytes(orjson.dumps(returns_summary, option=orjson.OPT_INDENT_2))
 
     logger.info("Fed returns summary saved")
 
 
-def main():
+@app.command()
+def main(
+    html: bool = typer.Option(
+        False,
+        "--html",
+        help="Also write standalone HTML figures next to the frontend JSON",
+    ),
+):
     """Run the readable Fed event analysis."""
-    create_readable_individual_analysis()
+    # Figure serialization and file writes run in the background while the next
+    # figure is built; the pool waits for them on exit
+    writes: list[Future] = []
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="fed-writes") as pool:
+
+        def submit_write(write, *args, **kwargs) -> None:
+            writes.append(pool.submit(write, *args, **kwargs))
+
+        create_readable_individual_analysis(submit_write, write_html=html)
+
+        create_readable_comparative_analysis(submit_write, write_html=html)
 
-    create_readable_comparative_analysis()
+        create_returns_analysis(submit_write, write_html=html)
 
-    create_returns_analysis()
+    # Re-raise the first failed write
+    for future in writes:
+        future.result()
 
 
 if __name__ == "__main__":
-    main()
+    app()
@@ -4,6 +4,7 @@ Sources vs Performance Analysis Script.
 Investigates the correlation between number of sources used and model performance.
 """
 
+from collections import defaultdict
 from pathlib import Path
 
 import numpy as np
@@ -19,29 +20,37 @@ def extract_model_level_data(backend_data):
 
     model_data = []
 
+    # Index decisions by model once instead of rescanning them for every model
+    decisions_by_model = defaultdict(list)
+    for model_decision in backend_data.model_decisions:
+        decisions_by_model[model_decision.model_id].append(model_decision)
+
     for model_id, performance in backend_data.performance_per_model.items():
         # Find all decisions for this model to calculate source statistics
         model_decisions = []
         model_name = None
-
-        for model_decision in backend_data.model_decisions:
-            if model_decision.model_id == model_id:
-                if model_name is None:
-                    model_name = model_decision.model_info.model_pretty_name
-
-                # Extract sources for each event decision
-                for event_decision in model_decision.event_investment_decisions:
-                    google_sources = event_decision.sources_google or []
-                    webpage_sources = event_decision.sources_visit_webpage or []
-
-                    model_decisions.append(
-                        {
-                            "google_sources_count": len(google_sources),
-                            "webpage_sources_count": len(webpage_sources),
-                            "total_sources_count": len(google_sources)
-                            + len(webpage_sources),
-                        }
-                    )
+        is_baseline = False
+
+        for model_decision in decisions_by_model.get(model_id, []):
+            if model_name is None:
+                model_name = model_decision.model_info.model_pretty_name
+                is_baseline = (
+                    "baseline" in model_decision.model_info.inference_provider.lower()
+                )
+
+            # Extract sources for each event decision
+            for event_decision in model_decision.event_investment_decisions:
+                google_sources = event_decision.sources_google or []
+                webpage_sources = event_decision.sources_visit_webpage or []
+
+                model_decisions.append(
+                    {
+                        "google_sources_count": len(google_sources),
+                        "webpage_sources_count": len(webpage_sources),
+                        "total_sources_count": len(google_sources)
+                        + len(webpage_sources),
+                    }
+                )
 
         if not model_decisions:
             continue
@@ -50,7 +59,8 @@ def extract_model_level_data(backend_data):
         sources_df = pd.DataFrame(model_decisions)
 
         # Special handling for Sonar Deep Research - assign 20 Google + 16.5 webpage sources
-        if model_name and "Sonar Deep Research" in model_name:
+        is_sonar = bool(model_name) and "Sonar Deep Research" in model_name
+        if is_sonar:
             mean_total_sources = 36.5
             median_total_sources = 36.5
             mean_google_sources = 20.0
@@ -69,6 +79,8 @@ def extract_model_level_data(backend_data):
             {
                 "model_id": model_id,
                 "model_name": model_name,
+                "is_sonar": is_sonar,
+                "is_baseline": is_baseline,
                 "final_brier_score": performance.final_brier_score,
                 "average_return_1d": performance.average_returns.one_day_return,
                 "average_return_7d": performance.average_returns.seven_day_return,
@@ -95,42 +107,91 @@ def calculate_correlations(df):
 
     correlations = {}
 
-    # Define metric pairs to analyze (using mean and median source counts)
-    metric_pairs = [
-        ("mean_total_sources", "final_brier_score"),
-        ("mean_total_sources", "average_return_7d"),
-        ("median_total_sources", "final_brier_score"),
-        ("median_total_sources", "average_return_7d"),
-        ("mean_google_sources", "final_brier_score"),
-        ("mean_google_sources", "average_return_7d"),
-        ("median_google_sources", "final_brier_score"),
-        ("median_google_sources", "average_return_7d"),
-        ("mean_webpage_sources", "final_brier_score"),
-        ("mean_webpage_sources", "average_return_7d"),
-        ("median_webpage_sources", "final_brier_score"),
-        ("median_webpage_sources", "average_return_7d"),
+    # Source metrics (mean and median counts) analyzed against each performance metric
+    source_metrics = [
+        "mean_total_sources",
+        "median_total_sources",
+        "mean_google_sources",
+        "median_google_sources",
+        "mean_webpage_sources",
+        "median_webpage_sources",
     ]
+    performance_metrics = ["final_brier_score", "average_return_7d"]
 
-    for x_metric, y_metric in metric_pairs:
+    # Compute all correlations against one performance metric in a single matrix
+    # product instead of one scipy.stats.pearsonr call per pair
+    pair_stats = {}
+    for y_metric in performance_metrics:
         # Filter out rows with missing data
-        valid_data = df.dropna(subset=[x_metric, y_metric])
+        valid_data = df[source_metrics + [y_metric]].dropna()
+        n_samples = len(valid_data)
+
+        if n_samples <= 3:  # Need sufficient data points
+            continue
 
-        if len(valid_data) > 3:  # Need sufficient data points
-            # Calculate Pearson correlation
-            corr_coef, p_value = stats.pearsonr(
-                valid_data[x_metric], valid_data[y_metric]
+        x_values = valid_data[source_metrics].to_numpy(dtype=float)
+        y_values = valid_data[y_metric].to_numpy(dtype=float)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_standardized = (x_values - x_values.mean(axis=0)) / x_values.std(
+                axis=0, ddof=1
+            )
+            y_standardized = (y_values - y_values.mean()) / y_values.std(ddof=1)
+            corr_coefs = np.clip(
+                x_standardized.T @ y_standardized / (n_samples - 1), -1.0, 1.0
+            )
+            t_stats = corr_coefs * np.sqrt((n_samples - 2) / (1 - corr_coefs**2))
+        p_values = 2 * stats.t.sf(np.abs(t_stats), n_samples - 2)
+
+        for x_metric, corr_coef, p_value in zip(source_metrics, corr_coefs, p_values):
+            pair_stats[(x_metric, y_metric)] = (
+                float(corr_coef),
+                float(p_value),
+                n_samples,
             )
 
+    # Keep the source-major ordering of the summary
+    for x_metric in source_metrics:
+        for y_metric in performance_metrics:
+            if (x_metric, y_metric) not in pair_stats:
+                continue
+            corr_coef, p_value, n_samples = pair_stats[(x_metric, y_metric)]
             correlations[f"{x_metric}_vs_{y_metric}"] = {
                 "correlation": corr_coef,
                 "p_value": p_value,
-                "n_samples": len(valid_data),
+                "n_samples": n_samples,
                 "significant": p_value < 0.05,
             }
 
     return correlations
 
 
+def _add_trendline(fig, x, y):
+    """Add a least-squares trend line of y against x to the figure."""
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # Closed-form least squares: a degree-1 fit does not need polyfit's SVD
+    x_mean, y_mean = x.mean(), y.mean()
+    slope = ((x - x_mean) * (y - y_mean)).sum() / ((x - x_mean) ** 2).sum()
+    intercept = y_mean - slope * x_mean
+
+    # A straight line only needs its two endpoints
+    x_trend = np.array([x.min(), x.max()])
+    y_trend = slope * x_trend + intercept
+
+    fig.add_trace(
+        go.Scatter(
+            x=x_trend,
+            y=y_trend,
+            mode="lines",
+            name="Trend Line",
+            line=dict(color="red", dash="dash"),
+        )
+    )
+
+
 def create_sources_vs_brier_scatter(df):
     """Create scatter plot of mean sources count vs Brier score."""
 
@@ -138,7 +199,7 @@ def create_sources_vs_brier_scatter(df):
 
     # Add scatter plot
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df["mean_total_sources"],
             y=df["final_brier_score"],
             mode="markers",
@@ -156,31 +217,17 @@ def create_sources_vs_brier_scatter(df):
                 "Mean Total Sources: %{x:.1f}<br>"
                 "Brier Score: %{y:.3f}<br>"
                 "Trades: %{marker.color}<br>"
-                "Decisions: " + df["decisions_count"].astype(str) + "<br>"
+                "Decisions: %{customdata}<br>"
                 "<extra></extra>"
             ),
+            customdata=df["decisions_count"].to_numpy(),
             name="Models",
         )
     )
 
     # Add trendline
     if len(df) > 1:
-        z = np.polyfit(df["mean_total_sources"], df["final_brier_score"], 1)
-        p = np.poly1d(z)
-        x_trend = np.linspace(
-            df["mean_total_sources"].min(), df["mean_total_sources"].max(), 100
-        )
-        y_trend = p(x_trend)
-
-        fig.add_trace(
-            go.Scatter(
-                x=x_trend,
-                y=y_trend,
-                mode="lines",
-                name="Trend Line",
-                line=dict(color="red", dash="dash"),
-            )
-        )
+        _add_trendline(fig, df["mean_total_sources"], df["final_brier_score"])
 
     fig.update_layout(
         xaxis_title="Mean Total Sources Count",
@@ -199,7 +246,7 @@ def create_sources_vs_returns_scatter(df):
 
     # Add scatter plot
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df["mean_total_sources"],
             y=df["average_return_7d"] * 100,
             mode="markers",
@@ -214,32 +261,20 @@ def create_sources_vs_returns_scatter(df):
                 "<b>%{text}</b><br>"
                 "Mean Total Sources: %{x:.1f}<br>"
                 "7d Avg Return: %{y:.2f}%<br>"
-                "Trades: " + df["trades_count"].astype(str) + "<br>"
-                "Decisions: " + df["decisions_count"].astype(str) + "<br>"
+                "Trades: %{customdata[0]}<br>"
+                "Decisions: %{customdata[1]}<br>"
                 "<extra></extra>"
             ),
+            customdata=np.column_stack(
+                [df["trades_count"].to_numpy(), df["decisions_count"].to_numpy()]
+            ),
             name="Models",
         )
     )
 
     # Add trendline
     if len(df) > 1:
-        z = np.polyfit(df["mean_total_sources"], df["average_return_7d"] * 100, 1)
-        p = np.poly1d(z)
-        x_trend = np.linspace(
-            df["mean_total_sources"].min(), df["mean_total_sources"].max(), 100
-        )
-        y_trend = p(x_trend)
-
-        fig.add_trace(
-            go.Scatter(
-                x=x_trend,
-                y=y_trend,
-                mode="lines",
-                name="Trend Line",
-                line=dict(color="red", dash="dash"),
-            )
-        )
+        _add_trendline(fig, df["mean_total_sources"], df["average_return_7d"] * 100)
 
     fig.update_layout(
         xaxis_title="Mean Total Sources Count",
@@ -255,7 +290,7 @@ def create_webpage_sources_vs_returns_scatter(df):
     """Create scatter plot of mean webpage sources count vs average returns (excluding Sonar)."""
 
     # Exclude Sonar Deep Research to reduce outlier bias
-    df_no_sonar = df[~df["model_name"].str.contains("Sonar", na=False)]
+    df_no_sonar = df[~df["is_sonar"]]
 
     fig = go.Figure()
 
@@ -270,7 +305,7 @@ def create_webpage_sources_vs_returns_scatter(df):
 
     # Add scatter plot
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df_no_sonar["mean_webpage_sources"],
             y=df_no_sonar["average_return_7d"] * 100,
             mode="markers+text",
@@ -278,15 +313,19 @@ def create_webpage_sources_vs_returns_scatter(df):
             textposition="top right",
             marker=dict(size=10, color=BLUE),
             hovertemplate=(
-                "<b>%{customdata}</b><br>"
-                "Decisions: " + df_no_sonar["decisions_count"].astype(str) + "<br>"
+                "<b>%{customdata[0]}</b><br>"
+                "Decisions: %{customdata[1]}<br>"
                 "Mean Visited Webpages: %{x:.1f}<br>"
                 "7d Avg Return: %{y:.2f}%<br>"
                 "<extra></extra>"
             ),
-            customdata=df_no_sonar[
-                "model_name"
-            ],  # Use customdata for hover since text is selective
+            # Use customdata for hover since text is selective
+            customdata=np.column_stack(
+                [
+                    df_no_sonar["model_name"].to_numpy(),
+                    df_no_sonar["decisions_count"].to_numpy(),
+                ]
+            ),
             showlegend=False,
         )
     )
@@ -310,7 +349,7 @@ def create_sources_breakdown_scatter(df):
 
     # Add scatter plot
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df["mean_google_sources"],
             y=df["mean_webpage_sources"],
             mode="markers",
@@ -329,9 +368,10 @@ def create_sources_breakdown_scatter(df):
                 "Mean Google Sources: %{x:.1f}<br>"
                 "Mean Webpage Sources: %{y:.1f}<br>"
                 "7d Avg Return: %{marker.color:.2f}%<br>"
-                "Decisions: " + df["decisions_count"].astype(str) + "<br>"
+                "Decisions: %{customdata}<br>"
                 "<extra></extra>"
             ),
+            customdata=df["decisions_count"].to_numpy(),
             name="Models",
         )
     )
@@ -403,13 +443,8 @@ def main():
         print("No model data found!")
         return
 
-    # Filter out baseline models
-    baseline_keywords = ["baseline", "random", "most_likely"]
-    df_filtered = df[
-        ~df["model_name"]
-        .str.lower()
-        .str.contains("|".join(baseline_keywords), na=False)
-    ]
+    # Filter out baseline models, tagged from their inference provider at extraction
+    df_filtered = df[~df["is_baseline"]]
 
     print(
         f"Analyzing {len(df_filtered)} models (filtered out {len(df) - len(df_filtered)} baselines)..."
@@ -450,31 +485,31 @@ def main():
     # print("Creating sources vs Brier score plot...")
     # fig1 = create_sources_vs_brier_scatter(df_filtered)
     # apply_template(fig1)
-    # fig1.write_json(output_dir / "sources_vs_brier_score.json")
+    # fig1.write_json(output_dir / "sources_vs_brier_score.json", engine="orjson")
 
     # 2. Sources vs Returns
     # print("Creating sources vs returns plot...")
     # fig2 = create_sources_vs_returns_scatter(df_filtered)
     # apply_template(fig2)
-    # fig2.write_json(output_dir / "sources_vs_returns.json")
+    # fig2.write_json(output_dir / "sources_vs_returns.json", engine="orjson")
 
     # 3. Webpage Sources vs Returns
     print("Creating webpage sources vs returns plot...")
     fig3 = create_webpage_sources_vs_returns_scatter(df_filtered)
     apply_template(fig3)
-    fig3.write_json(output_dir / "webpage_sources_vs_returns.json")
+    fig3.write_json(output_dir / "webpage_sources_vs_returns.json", engine="orjson")
 
     # 4. Sources breakdown
     # print("Creating sources breakdown plot...")
     # fig4 = create_sources_breakdown_scatter(df_filtered)
     # apply_template(fig4)
-    # fig4.write_json(output_dir / "google_vs_webpage_sources.json")
+    # fig4.write_json(output_dir / "google_vs_webpage_sources.json", engine="orjson")
 
     # 5. Correlation summary table
     # print("Creating correlation summary table...")
     # fig5 = create_correlation_summary_table(correlations)
     # apply_template(fig5)
-    # fig5.write_json(output_dir / "correlation_summary.json")
+    # fig5.write_json(output_dir / "correlation_summary.json", engine="orjson")
 
 
 if __name__ == "__main__":
@@ -6,17 +6,48 @@ This script computes all data needed for the backend API endpoints and saves
 it to storage using the storage utilities.
 """
 
+import hashlib
 import json
+import tempfile
 from datetime import datetime
+from pathlib import Path
 
 import typer
 from predibench.backend.data_loader import get_data_for_backend
 from predibench.common import DATA_PATH
-from predibench.storage_utils import write_to_storage
+from predibench.storage_utils import (
+    read_from_storage_if_exists,
+    upload_file_to_storage,
+    write_to_storage,
+)
 
 app = typer.Typer(help="Generate precomputed backend cache data")
 
 
+def _stored_cache_hash(meta_file_path: Path) -> str | None:
+    """Return the payload hash recorded for the stored cache, if any."""
+    meta = read_from_storage_if_exists(meta_file_path)
+    if meta is None:
+        return None
+    return json.loads(meta).get("blake2b")
+
+
+def _dump_and_hash(data: dict, path: Path) -> str:
+    """Stream data as compact JSON into path and return the content hash.
+
+    Chunks are written as they are encoded, so the serialized cache never has to
+    sit in memory next to the dict it came from.
+    """
+    # Compact separators: the cache is only read back by the API, never by hand
+    with path.open("w", encoding="utf-8") as fp:
+        json.dump(data, fp, separators=(",", ":"), default=str)
+    content_hash = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+
 @app.command()
 def main(
     recompute_bets_with_kelly_criterion: bool = typer.Option(
@@ -31,6 +62,11 @@ def main(
         "--ignored-providers",
         help="List of provider names to ignore when generating cache (e.g., 'openai', 'anthropic')",
     ),
+    force_rewrite: bool = typer.Option(
+        False,
+        "--force-rewrite",
+        help="Upload the cache even if its content has not changed",
+    ),
 ):
     """Compute and persist backend cache data for the API."""
     typer.echo("=== Backend Cache Generation ===")
@@ -51,12 +87,21 @@ def main(
     # Convert to JSON-serializable format
     typer.echo("\n2. Converting to JSON format...")
     backend_data_dict = backend_data.model_dump()
-    json_content = json.dumps(backend_data_dict, indent=2, default=str)
 
-    # Save using storage utilities
+    # Save using storage utilities, skipping the upload when nothing changed
     cache_file_path = DATA_PATH / "backend_cache.json"
-    typer.echo("\n3. Saving to storage...")
-    write_to_storage(cache_file_path, json_content)
+    meta_file_path = DATA_PATH / "backend_cache.meta.json"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_file_path = Path(tmp_dir) / cache_file_path.name
+        content_hash = _dump_and_hash(backend_data_dict, json_file_path)
+        # The meta file is only written after the cache upload succeeds, so a
+        # matching hash means the stored cache is already this content
+        if not force_rewrite and _stored_cache_hash(meta_file_path) == content_hash:
+            typer.echo("\n3. Cache content unchanged, skipping upload")
+        else:
+            typer.echo("\n3. Saving to storage...")
+            upload_file_to_storage(cache_file_path, json_file_path)
+            write_to_storage(meta_file_path, json.dumps({"blake2b": content_hash}))
 
     # Print summary statistics
     typer.echo("\n=== Cache Generation Complete ===")
@@ -2,7 +2,6 @@ from datetime import date, timedelta
 
 import typer
 from predibench.common import DEFAULT_DAYS_AHEAD, DEFAULT_MAX_EVENTS
-from predibench.invest import run_investments_for_specific_date
 from predibench.logger_config import get_logger
 from predibench.models import MODEL_MAP, MODELS_BY_PROVIDER
 from predibench.retry_models import retry, stop_after_attempt
@@ -11,6 +10,9 @@ logger = get_logger(__name__)
 
 app = typer.Typer()
 
+# Provider argument -> models to run, resolved once instead of per invocation
+MODELS_BY_CHOICE = {**MODELS_BY_PROVIDER, "all": MODEL_MAP, "events": []}
+
 
 @app.command()
 @retry(
@@ -27,16 +29,13 @@ def main(
     days_ahead: int = typer.Option(DEFAULT_DAYS_AHEAD, help="Days until event ending"),
 ):
     """Main script to run investment analysis for models from a specific provider."""
+    # Imported here: predibench.invest loads the agent and LLM client stack and
+    # logs into the Hub, which --help and argument errors do not need
+    from predibench.invest import run_investments_for_specific_date
 
-    if provider == "all":
-        models = MODEL_MAP
-    elif provider == "events":
-        models = []
-    elif provider in MODELS_BY_PROVIDER:
-        models = MODELS_BY_PROVIDER[provider]
-
-    else:
-        available_providers = ", ".join(list(MODELS_BY_PROVIDER.keys()) + ["all"])
+    models = MODELS_BY_CHOICE.get(provider)
+    if models is None:
+        available_providers = ", ".join(MODELS_BY_CHOICE)
         typer.echo(
             f"Error: Provider '{provider}' not found. Available providers and models: {available_providers}"
         )
@@ -1,12 +1,11 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta, datetime
 from typing import List
 
 import typer
 from dotenv import load_dotenv
-from huggingface_hub import login
 from predibench.agent.models import ModelInfo
-from predibench.invest import run_investments_for_specific_date
 from predibench.logger_config import get_logger
 from predibench.models import MODELS_BY_PROVIDER
 
@@ -15,9 +14,11 @@ logger = get_logger(__name__)
 app = typer.Typer()
 
 load_dotenv()
-login(os.getenv("HF_TOKEN"))
 
 BACKWARD_MODE_MODELS = MODELS_BY_PROVIDER["baseline"]
+# Dates are independent (separate output folders) and spend their time on
+# Polymarket and bucket I/O, so a few of them can run at once
+MAX_PARALLEL_DATES = 4
 
 
 @app.command()
@@ -27,6 +28,11 @@ def main(
     dates: List[str] = typer.Option(help="List of dates to process (YYYY-MM-DD format)"),
 ):
     """Main script to run investment analysis with all models for specified dates."""
+    # Heavy imports and the Hub login only happen once a run actually starts
+    from huggingface_hub import login
+    from predibench.invest import run_investments_for_specific_date
+
+    login(os.getenv("HF_TOKEN"))
 
     logger.info(f"Starting investment analysis for dates: {dates}")
 
@@ -37,7 +43,7 @@ def main(
         dates_to_process.append(parsed_date)
 
     # Run for each date and each model
-    for target_date in dates_to_process:
+    def run_for_date(target_date: date) -> None:
         run_investments_for_specific_date(
             time_until_ending=timedelta(days=days_ahead),
             max_n_events=max_events,
@@ -46,6 +52,10 @@ def main(
             force_rewrite=True,
         )
 
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DATES) as executor:
+        # Consume the results so that a failure for any date is raised here
+        list(executor.map(run_for_date, dates_to_process))
+
     logger.info("All analyses completed")
 
 
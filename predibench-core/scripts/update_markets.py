@@ -6,7 +6,7 @@ This script will scan the timeseries_cache directory for existing cached markets
 and update their timeseries data if they are not marked as closed.
 """
 
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from predibench.logger_config import get_logger
 from predibench.polymarket_api import _HistoricalTimeSeriesRequestParameters
@@ -14,6 +14,10 @@ from predibench.storage_utils import get_bucket, has_bucket_read_access
 
 logger = get_logger(__name__)
 
+# Each update is dominated by bucket and Polymarket API round-trips; keep the
+# pool modest so the API is not flooded with concurrent requests
+MAX_UPDATE_WORKERS = 16
+
 
 def list_cached_markets() -> list[str]:
     """
@@ -31,20 +35,28 @@ def list_cached_markets() -> list[str]:
         logger.error("Could not get bucket")
         return []
 
-    # List all blobs in the timeseries_cache directory
+    # List all blobs in the timeseries_cache directory; only their names are
+    # used, so ask for just those instead of the full object metadata
     cache_prefix = "timeseries_cache/"
-    blobs = bucket.list_blobs(prefix=cache_prefix)
+    blobs = bucket.list_blobs(
+        prefix=cache_prefix,
+        projection="noAcl",
+        fields="items(name),nextPageToken",
+        # GCS caps pages at 1000 items; ask for full pages to minimise round-trips
+        page_size=1000,
+    )
 
     cached_markets = []
 
     for blob in blobs:
         # Extract clob_token_id from the blob name
         # Format: timeseries_cache/{clob_token_id}.json
-        blob_path = Path(blob.name)
-        if blob_path.suffix == ".json":
-            clob_token_id = blob_path.stem
+        # Plain string slicing: this runs for every blob in the cache
+        name = blob.name
+        if name.endswith(".json"):
+            clob_token_id = name.rpartition("/")[2][: -len(".json")]
             cached_markets.append(clob_token_id)
-            logger.info(f"Found cached data for token: {clob_token_id}")
+            logger.debug("Found cached data for token: %s", clob_token_id)
 
     return cached_markets
 
@@ -92,13 +104,18 @@ def main():
     successful_updates = 0
     failed_updates = 0
 
-    for i, clob_token_id in enumerate(cached_markets, 1):
-        print(f"[{i}/{len(cached_markets)}] Updating {clob_token_id}...")
-
-        if update_market(clob_token_id):
-            successful_updates += 1
-        else:
-            failed_updates += 1
+    with ThreadPoolExecutor(max_workers=MAX_UPDATE_WORKERS) as executor:
+        futures = {
+            executor.submit(update_market, clob_token_id): clob_token_id
+            for clob_token_id in cached_markets
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            print(f"[{i}/{len(cached_markets)}] Updated {futures[future]}")
+
+            if future.result():
+                successful_updates += 1
+            else:
+                failed_updates += 1
 
     print("-" * 80)
     print("Update complete!")
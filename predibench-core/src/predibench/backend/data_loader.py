@@ -11,6 +11,7 @@ from predibench.backend.data_model import (
     BackendData,
     EventBackend,
     FullModelResult,
+    ModelPerformanceBackend,
 )
 from predibench.backend.events import get_non_duplicated_events
 from predibench.backend.leaderboard import get_leaderboard
@@ -122,24 +123,18 @@ def load_market_prices(events: list[Event]) -> dict[str, pd.Series | None]:
     return market_to_prices
 
 
-def get_data_for_backend(
-    recompute_bets_with_kelly_criterion: bool = False,
+def load_backend_inputs(
     ignored_providers: list[str] | None = None,
-    custom_horizons: list[int] | None = None,
-) -> BackendData:
+) -> tuple[list[ModelInvestmentDecisions], list[Event], pd.DataFrame]:
     """
-    Pre-compute all data needed for backend API endpoints.
-
-    This function loads all data sources only once and computes everything needed
-    for maximum performance at runtime.
+    Load the base data sources that all backend computations derive from.
 
     Args:
-        recompute_bets_with_kelly_criterion: Whether to recompute all bets using Kelly criterion
         ignored_providers: List of provider names to ignore (case-insensitive)
-    """
-    logger.info("Starting comprehensive backend data computation...")
 
-    # Step 1: Load all base data sources (load once, use everywhere)
+    Returns:
+        The model decisions, the deduplicated events and the daily market prices
+    """
     logger.info("Loading base data sources...")
     model_decisions = load_investment_choices_from_google()  # Load once
 
@@ -167,6 +162,57 @@ def get_data_for_backend(
     # prices_df = prices_df.resample("D").last()  # Do this BEFORE _to_date_index
     prices_df = _to_date_index(prices_df)
 
+    return model_decisions, events, prices_df
+
+
+def compute_backend_profits(
+    prices_df: pd.DataFrame,
+    model_decisions: list[ModelInvestmentDecisions],
+    recompute_bets_with_kelly_criterion: bool = False,
+    custom_horizons: list[int] | None = None,
+) -> tuple[list[ModelInvestmentDecisions], dict[str, ModelPerformanceBackend]]:
+    """
+    Compute the enriched decisions and per-model performance from loaded inputs.
+
+    The decisions are enriched in place, and their bets are rescaled when
+    recomputing with Kelly, so pass a copy to keep the originals untouched.
+
+    Args:
+        prices_df: Daily market prices, as returned by load_backend_inputs
+        model_decisions: Model decisions, as returned by load_backend_inputs
+        recompute_bets_with_kelly_criterion: Whether to recompute all bets using Kelly criterion
+        custom_horizons: Extra return horizons in days to compute
+    """
+    return _compute_profits(
+        prices_df=prices_df,
+        model_decisions=model_decisions,
+        recompute_bets_with_kelly_criterion=recompute_bets_with_kelly_criterion,
+        custom_horizons=custom_horizons,
+    )
+
+
+def get_data_for_backend(
+    recompute_bets_with_kelly_criterion: bool = False,
+    ignored_providers: list[str] | None = None,
+    custom_horizons: list[int] | None = None,
+) -> BackendData:
+    """
+    Pre-compute all data needed for backend API endpoints.
+
+    This function loads all data sources only once and computes everything needed
+    for maximum performance at runtime.
+
+    Args:
+        recompute_bets_with_kelly_criterion: Whether to recompute all bets using Kelly criterion
+        ignored_providers: List of provider names to ignore (case-insensitive)
+    """
+    logger.info("Starting comprehensive backend data computation...")
+
+    # Step 1: Load all base data sources (load once, use everywhere)
+    model_decisions, events, prices_df = load_backend_inputs(
+        ignored_providers=ignored_providers
+    )
+
     # Step 1.5: Convert Polymarket Event models to backend Event models
     backend_events = [EventBackend.from_event(e) for e in events]
 
@@ -176,7 +222,7 @@ def get_data_for_backend(
     # When recomputing, apply Kelly using the original market price series
     # at the model's decision date; only bets are rescaled, unallocated stays.
 
-    enriched_model_decisions, performance_per_model = _compute_profits(
+    enriched_model_decisions, performance_per_model = compute_backend_profits(
         prices_df=prices_df,
         model_decisions=model_decisions,
         recompute_bets_with_kelly_criterion=recompute_bets_with_kelly_criterion,
@@ -5,6 +5,7 @@ import logging
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
+import orjson
 import pandas as pd
 import requests
 
@@ -32,8 +33,7 @@ from tenacity import (
 from predibench.common import BASE_URL_POLYMARKET, DATA_PATH
 from predibench.logger_config import get_logger
 from predibench.storage_utils import (
-    file_exists_in_storage,
-    read_from_storage,
+    read_from_storage_if_exists,
     write_to_storage,
 )
 from predibench.utils import convert_polymarket_time_to_datetime
@@ -43,6 +43,16 @@ MAX_INTERVAL_TIMESERIES = timedelta(days=14, hours=23, minutes=0)
 
 logger = get_logger(__name__)
 
+
+def _dump_cache(serialized_data: dict) -> str:
+    """Serialize timeseries cache data as compact JSON.
+
+    Cache files are only read back by code, and indenting the per-point records
+    made every file about 50% larger.
+    """
+    return json.dumps(serialized_data, separators=(",", ":"))
+
+
 # Common retry configuration for all API calls
 polymarket_retry = retry(
     stop=stop_after_attempt(3),
@@ -337,10 +347,11 @@ class _HistoricalTimeSeriesRequestParameters(BaseModel):
             raise ValueError("clob_token_id is None or empty")
 
         cache_path = self._get_cache_path()
+        cached_content = read_from_storage_if_exists(cache_path)
 
-        if file_exists_in_storage(cache_path):
+        if cached_content is not None:
             try:
-                cached_data = json.loads(read_from_storage(cache_path))
+                cached_data = orjson.loads(cached_content)
                 cached_timeseries = self._deserialize_timeseries(cached_data)
                 return cached_timeseries
 
@@ -360,9 +371,10 @@ class _HistoricalTimeSeriesRequestParameters(BaseModel):
         existing_data = None
 
         # Check if market is already marked as closed in cache
-        if file_exists_in_storage(cache_path):
+        cached_content = read_from_storage_if_exists(cache_path)
+        if cached_content is not None:
             try:
-                cached_data: dict = json.loads(read_from_storage(cache_path))
+                cached_data: dict = orjson.loads(cached_content)
                 if cached_data.get("is_closed", False) and not force_update:
                     logger.info(
                         f"Skipping update for closed market {self.clob_token_id}"
@@ -394,7 +406,7 @@ class _HistoricalTimeSeriesRequestParameters(BaseModel):
             serialized_data = self._serialize_timeseries(
                 final_data, is_closed=is_closed
             )
-            write_to_storage(cache_path, json.dumps(serialized_data, indent=2))
+            write_to_storage(cache_path, _dump_cache(serialized_data))
             logger.info(
                 f"Cached timeseries data for token {self.clob_token_id} (closed: {is_closed})"
             )
@@ -427,7 +439,7 @@ class _HistoricalTimeSeriesRequestParameters(BaseModel):
             serialized_data = self._serialize_timeseries(
                 merged_data, is_closed=is_closed
             )
-            write_to_storage(cache_path, json.dumps(serialized_data, indent=2))
+            write_to_storage(cache_path, _dump_cache(serialized_data))
             logger.info(
                 f"Cached timeseries data for token {self.clob_token_id} (closed: {is_closed})"
             )
@@ -451,12 +463,12 @@ class _HistoricalTimeSeriesRequestParameters(BaseModel):
             series_to_concat.append(ts1)
         if not ts2.empty:
             series_to_concat.append(ts2)
-        
+
         if not series_to_concat:
             return None
         if len(series_to_concat) == 1:
             return series_to_concat[0]
-            
+
         # Combine the series and remove duplicates, keeping the last (most recent) value
         combined = pd.concat(series_to_concat).groupby(level=0).last()
         return combined.sort_index()
@@ -474,18 +486,10 @@ class _HistoricalTimeSeriesRequestParameters(BaseModel):
 
     def _deserialize_timeseries(self, data: dict) -> pd.Series:
         """Convert JSON data back to pandas Series."""
-        series_data = []
-        timestamps = []
-
-        for item in data["data"]:
-            timestamp = pd.to_datetime(item["datetime"])
-            # Ensure timezone info is UTC
-            if timestamp.tzinfo is None:
-                timestamp = timestamp.replace(tzinfo=timezone.utc)
-            timestamps.append(timestamp)
-            series_data.append(item["value"])
-
-        return pd.Series(series_data, index=timestamps)
+        items = data["data"]
+        # Parse all timestamps in one vectorized call; naive ones are taken as UTC
+        timestamps = pd.to_datetime([item["datetime"] for item in items], utc=True)
+        return pd.Series([item["value"] for item in items], index=timestamps)
 
     def _is_cache_up_to_date(
         self, cached_timeseries: pd.Series, cached_data: dict | None = None
@@ -8,12 +8,13 @@ This module contains utility functions for interacting with Google Cloud Storage
 
 import json
 import os
+import shutil
 import uuid
 from functools import cache
 from pathlib import Path
 
 from dotenv import load_dotenv
-from google.api_core.exceptions import ClientError
+from google.api_core.exceptions import ClientError, NotFound
 from google.cloud import storage
 
 from predibench.common import DATA_PATH
@@ -198,6 +199,45 @@ def write_to_storage(file_path: Path, content: str) -> bool:
     return _write_to_bucket_or_data_dir(content, str(relative_path))
 
 
+def upload_file_to_storage(file_path: Path, source_path: Path) -> bool:
+    """
+    Copy a local file into storage at the given path relative to DATA_PATH.
+
+    Unlike write_to_storage, the content is streamed from disk instead of being
+    held in memory, which suits large generated files.
+
+    Args:
+        file_path: Destination path that must be relative to DATA_PATH
+        source_path: Local file whose content is stored
+
+    Raises:
+        ValueError: If the path is not relative to DATA_PATH
+    """
+    # Ensure the path is relative to DATA_PATH
+    if not file_path.is_relative_to(DATA_PATH):
+        raise ValueError(f"Path {file_path} is not relative to DATA_PATH {DATA_PATH}")
+
+    blob_name = str(file_path.relative_to(DATA_PATH))
+    if STORAGE_MODE_BUCKET:
+        # Use bucket storage only
+        if has_bucket_write_access():
+            bucket = get_bucket()
+            blob = bucket.blob(blob_name)
+            blob.upload_from_filename(str(source_path))
+            print(f"✅ Uploaded {blob_name} to bucket")
+        else:
+            raise RuntimeError(
+                f"Bucket storage mode enabled but GCP access not available. Set {BUCKET_ENV_VAR} environment variable or check GCP credentials."
+            )
+    else:
+        # Use local storage only
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source_path, file_path)
+        print(f"✅ Saved {blob_name} locally")
+
+    return True
+
+
 def _read_file_from_bucket_or_data_dir(blob_name: str) -> str:
     """
     Read a file from either bucket or local storage based on STORAGE_MODE_BUCKET.
@@ -243,6 +283,28 @@ def read_from_storage(file_path: Path) -> str:
     return _read_file_from_bucket_or_data_dir(str(relative_path))
 
 
+def read_from_storage_if_exists(file_path: Path) -> str | None:
+    """
+    Read a file from storage, or return None if it does not exist.
+
+    Costs a single bucket request, where file_exists_in_storage followed by
+    read_from_storage costs two.
+
+    Args:
+        file_path: Path object that must be relative to DATA_PATH
+
+    Returns:
+        Content of the file as string, or None if the file is not in storage
+
+    Raises:
+        ValueError: If the path is not relative to DATA_PATH
+    """
+    try:
+        return read_from_storage(file_path)
+    except (FileNotFoundError, NotFound):
+        return None
+
+
 def file_exists_in_storage(file_path: Path, force_rewrite: bool = False) -> bool:
     """
     Check if a file exists in storage based on STORAGE_MODE_BUCKET.
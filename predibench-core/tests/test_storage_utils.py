@@ -1,9 +1,43 @@
-from predibench.storage_utils import write_to_storage, read_from_storage
+import pytest
 
-from predibench.common import DATA_PATH
+from predibench import storage_utils
+from predibench.storage_utils import (
+    read_from_storage,
+    read_from_storage_if_exists,
+    upload_file_to_storage,
+    write_to_storage,
+)
 
 
-def test_storage_utils():
-    file_path = DATA_PATH / "test.txt"
+@pytest.fixture(autouse=True)
+def local_data_path(tmp_path, monkeypatch):
+    """Keep the storage tests in local mode, under a throwaway DATA_PATH."""
+    data_path = tmp_path / "data"
+    monkeypatch.setattr(storage_utils, "DATA_PATH", data_path)
+    monkeypatch.setattr(storage_utils, "STORAGE_MODE_BUCKET", False)
+    monkeypatch.setattr(storage_utils, "get_bucket", lambda: None)
+    return data_path
+
+
+def test_storage_utils(local_data_path):
+    file_path = local_data_path / "test.txt"
     write_to_storage(file_path, "test")
     assert read_from_storage(file_path) == "test"
+
+
+def test_read_from_storage_if_exists(local_data_path):
+    file_path = local_data_path / "test.txt"
+    write_to_storage(file_path, "test")
+    assert read_from_storage_if_exists(file_path) == "test"
+    assert read_from_storage_if_exists(local_data_path / "missing_file.txt") is None
+
+
+def test_upload_file_to_storage(local_data_path, tmp_path):
+    source_path = tmp_path / "source.txt"
+    source_path.write_text("uploaded")
+    file_path = local_data_path / "test_upload.txt"
+    upload_file_to_storage(file_path, source_path)
+    assert read_from_storage(file_path) == "uploaded"
+
+    with pytest.raises(ValueError):
+        upload_file_to_storage(tmp_path / "outside.txt", source_path)